@@ -0,0 +1,129 @@
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+import testapp
+from corpus import GOAL_SENTENCES, career_goals_text
+
+# extract_career_goal_keywords: the original implementation versus the compiled one,
+# on inputs from 1 KB upward. Time per KB staying flat as inputs grow means linear.
+def extract_original(career_goals):
+    if not career_goals:
+        return {}
+    goals_data = {"job_titles": [], "locations": [], "work_preferences": [], "industries": []}
+    job_title_patterns = [
+        r"(?:seeking|looking for|interested in)(?:\s+a)?\s+(?:role|position|job|career)?\s+(?:as|in)?\s+(?:an?)?\s+((?:senior|junior|lead|principal|staff)?\s*[a-z\s]+(?:engineer|developer|architect|manager|analyst|scientist|designer))",
+        r"(?:senior|junior|lead|principal|staff)?\s*([a-z\s]+(?:engineer|developer|architect|manager|analyst|scientist|designer))\s+(?:role|position|job)",
+        r"(?:become|be)\s+(?:a|an)\s+((?:senior|junior|lead|principal|staff)?\s*[a-z\s]+(?:engineer|developer|architect|manager|analyst|scientist|designer))"
+    ]
+    for pattern in job_title_patterns:
+        matches = re.findall(pattern, career_goals.lower())
+        if matches:
+            goals_data["job_titles"].extend([title.strip().title() for title in matches])
+    for title in testapp.CAREER_GAZETTEER["job_titles"]:
+        if title in career_goals.lower():
+            goals_data["job_titles"].append(title.title())
+    location_patterns = [
+        r"(?:in|near|around|based in)\s+([a-z\s]+(?:area|city|region|county))",
+        r"(?:in|near|around|based in)\s+([a-z]+,\s*[a-z]{2})",
+        r"(?:in|near|around|based in)\s+([a-z\s]+)"
+    ]
+    for pattern in location_patterns:
+        matches = re.findall(pattern, career_goals.lower())
+        if matches:
+            goals_data["locations"].extend([loc.strip().title() for loc in matches])
+    for category in ("locations", "work_preferences", "industries"):
+        for term in testapp.CAREER_GAZETTEER[category]:
+            if term in career_goals.lower():
+                goals_data[category].append(term.title())
+    for key in goals_data:
+        goals_data[key] = list(set(goals_data[key]))
+    return goals_data
+
+def extract_compiled(career_goals):
+    # Skip the memo so every call does the full extraction
+    return testapp.compile_career_goal_keywords.__wrapped__(career_goals)
+
+# Sentences whose title or location phrase runs past CAREER_PHRASE_MAX_LENGTH. The
+# capped phrase differs from the original's, but must still start on a whole word.
+LONG_PHRASE_GOALS = [
+    "After spending the last several years building backend systems at a small startup I would now "
+    "really like to move into a machine learning engineer role at a tech company",
+    "I am interested in working somewhere with a genuinely collaborative and inclusive engineering culture "
+    "in the greater san francisco bay area"
+]
+
+def check_long_phrases():
+    for text in LONG_PHRASE_GOALS:
+        lowered = text.lower()
+        result = extract_compiled(text)
+        for phrase in result["job_titles"] + result["locations"]:
+            if not re.search(rf"(?<![a-z]){re.escape(phrase.lower())}", lowered):
+                sys.exit(f"Phrase {phrase!r} starts mid-word in: {text!r}")
+    print(f"Phrases longer than the cap start on a whole word in {len(LONG_PHRASE_GOALS)} goal texts")
+
+def prose(size, seed):
+    return career_goals_text(size // 40 + 1, seed=seed)[:size]
+
+def run_on(size, seed):
+    # One long unpunctuated paragraph: the worst case for the original patterns
+    rng = random.Random(seed)
+    words = " ".join(re.sub(r"[^a-z ]", "", sentence.lower()) for sentence in GOAL_SENTENCES).split()
+    text = ""
+    while len(text) < size:
+        text += rng.choice(words) + " "
+    return text[:size]
+
+def median_time(fn, text, repeat, budget):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        timings.append(time.perf_counter() - start)
+        if sum(timings) > budget:
+            break
+    timings.sort()
+    return timings[len(timings) // 2]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark career goal keyword extraction")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32], help="Input sizes in KB")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--original-budget", type=float, default=10.0,
+                        help="Stop timing the original implementation once one size takes longer than this")
+    args = parser.parse_args()
+
+    # Same keywords as the original wherever no phrase outgrows CAREER_PHRASE_MAX_LENGTH
+    for seed in range(200):
+        text = career_goals_text(random.Random(seed).randint(1, 12), seed=seed)
+        expected = {key: set(values) for key, values in extract_original(text).items()}
+        got = {key: set(values) for key, values in extract_compiled(text).items()}
+        if expected != got:
+            sys.exit(f"Output differs from the original on: {text!r}\n{expected}\n{got}")
+    print("Compiled extractor matches the original on 200 sample goal texts")
+    check_long_phrases()
+
+    for label, make in (("prose", prose), ("unpunctuated run", run_on)):
+        print(f"\n{label}")
+        print(f"{'size':>8} {'original':>12} {'ms/KB':>8} {'compiled':>12} {'ms/KB':>8}")
+        original_done = False
+        for kb in args.sizes:
+            text = make(kb * 1024, seed=kb)
+            compiled = median_time(extract_compiled, text, args.repeat, float("inf"))
+            if original_done:
+                original_cell = f"{'skipped':>12} {'':>8}"
+            else:
+                original = median_time(extract_original, text, args.repeat, args.original_budget)
+                original_done = original > args.original_budget
+                original_cell = f"{original * 1000:10.1f}ms {original * 1000 / kb:8.2f}"
+            print(f"{kb:>6}KB {original_cell} {compiled * 1000:10.2f}ms {compiled * 1000 / kb:8.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT, "benchmarks", "fixtures")
+sys.path.insert(0, ROOT)
+
+import testapp
+
+# Compare every Dice card parser backend on saved search result pages
+def time_backend(backend, pages, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in pages.values():
+            testapp.parse_dice_cards(html, "Benchmark", backend=backend)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2] / len(pages)
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark for the Dice card parsers")
+    parser.add_argument("--fixtures", default=os.path.join(FIXTURES_DIR, "dice_*.html"))
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = {}
+    for path in sorted(glob.glob(args.fixtures)):
+        with open(path, encoding="utf-8") as f:
+            pages[os.path.basename(path)] = f.read()
+    if not pages:
+        sys.exit(f"No fixtures match {args.fixtures}")
+
+    backends = [name for name in testapp.DICE_PARSERS if name != "lxml" or testapp.lxml is not None]
+
+    # Every backend must extract exactly what the original parser does
+    for name, html in pages.items():
+        expected = testapp.parse_dice_cards(html, "Benchmark", backend="html.parser")
+        for backend in backends:
+            if testapp.parse_dice_cards(html, "Benchmark", backend=backend) != expected:
+                sys.exit(f"{backend} output differs from html.parser on {name}")
+
+    print(f"{len(pages)} fixture pages, median of {args.repeat} runs")
+    baseline = time_backend("html.parser", pages, args.repeat)
+    for backend in backends:
+        per_page = baseline if backend == "html.parser" else time_backend(backend, pages, args.repeat)
+        print(f"{backend:>12}: {per_page * 1000:8.2f} ms/page  {baseline / per_page:5.1f}x")
+
+if __name__ == "__main__":
+    main()
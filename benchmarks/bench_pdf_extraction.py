@@ -0,0 +1,55 @@
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pdfplumber
+import testapp
+from corpus import named_stream, render_pdf, resume_lines
+
+# PDF text extraction on synthetic multi-page resumes: the original
+# double-extract loop versus every single-pass backend, plus early stopping
+def extract_double_pass(stream):
+    with pdfplumber.open(stream) as pdf:
+        return "\n".join([page.extract_text() for page in pdf.pages if page.extract_text()]).strip()
+
+def median_time(fn, data, repeat):
+    timings = []
+    for _ in range(repeat):
+        stream = named_stream(data, "resume.pdf")
+        start = time.perf_counter()
+        fn(stream)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF text extraction backends")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    variants = [("double pass (old)", extract_double_pass)]
+    backends = ["layout", "simple"] + (["pdfium"] if testapp.pdfium is not None else [])
+    for backend in backends:
+        variants.append((backend, lambda stream, backend=backend: testapp.extract_text_from_pdf(stream, backend=backend)))
+    variants.append(("layout, early stop", lambda stream: testapp.extract_text_from_pdf(
+        stream, stop_when=testapp.sections_complete("Details", "Profile")
+    )))
+
+    for pages in args.pages:
+        data = render_pdf(resume_lines(pages, seed=pages))
+        expected = extract_double_pass(named_stream(data, "resume.pdf"))
+        same = testapp.extract_text_from_pdf(named_stream(data, "resume.pdf"), backend="layout") == expected
+        print(f"{pages} page(s), {len(data) // 1024} KB, single pass output identical: {same}")
+        baseline = None
+        for name, fn in variants:
+            seconds = median_time(fn, data, args.repeat)
+            baseline = baseline or seconds
+            print(f"  {name:>20}: {seconds * 1000:8.1f} ms  {baseline / seconds:5.1f}x")
+
+if __name__ == "__main__":
+    main()
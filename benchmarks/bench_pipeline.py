@@ -0,0 +1,211 @@
+import argparse
+import glob
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT, "benchmarks", "fixtures")
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baselines.json")
+sys.path.insert(0, ROOT)
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+import testapp
+from corpus import career_goals_text, named_stream, render_docx, render_pdf, resume_lines
+
+# Per-stage benchmarks for the parse -> scrape -> score pipeline. Every stage reports
+# median latency per call, throughput in items/sec and tracemalloc peak memory, and
+# is compared against a baseline file written by an earlier --save-baseline run.
+# Baselines are machine specific: record them on the machine the comparisons run on.
+#
+#   python benchmarks/bench_pipeline.py --save-baseline
+#   python benchmarks/bench_pipeline.py --check
+
+def load_fixture_pages():
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "dice_*.html"))):
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+    return pages
+
+def sample_jobs(pages):
+    jobs = []
+    for html in pages:
+        jobs.extend(testapp.parse_dice_cards(html, "Software Engineer"))
+    return jobs
+
+def sample_resume():
+    text = "\n".join(resume_lines(2, seed=7))
+    return testapp.parse_resume_text(text)
+
+def build_stages():
+    # name -> (setup, fn, items per call). setup runs before every call, outside timing and memory tracking.
+    stages = {}
+    for pages in (1, 5, 20):
+        data = render_pdf(resume_lines(pages, seed=pages))
+        stages[f"parse_resume.pdf.{pages}p"] = (
+            lambda data=data: named_stream(data, "resume.pdf"), testapp.parse_resume, 1
+        )
+    for pages in (1, 5):
+        data = render_docx(resume_lines(pages, seed=pages))
+        stages[f"parse_resume.docx.{pages}p"] = (
+            lambda data=data: named_stream(data, "resume.docx"), testapp.parse_resume, 1
+        )
+
+    fixture_pages = load_fixture_pages()
+    stages["parse_dice_cards"] = (
+        lambda: fixture_pages,
+        lambda pages: [testapp.parse_dice_cards(html, "Software Engineer") for html in pages],
+        len(fixture_pages)
+    )
+
+    def uncached(text):
+        # The extractor is memoized on the text; empty the memo so every sample is a miss
+        testapp.compile_career_goal_keywords.cache_clear()
+        return text
+
+    for sentences in (5, 50):
+        text = career_goals_text(sentences, seed=sentences)
+        stages[f"extract_career_goal_keywords.{sentences}s"] = (
+            lambda text=text: uncached(text), testapp.extract_career_goal_keywords, 1
+        )
+
+    jobs = sample_jobs(fixture_pages) * 10
+    resume = sample_resume()
+    motivation = {"preferred_location": "Remote", "career_goals": career_goals_text(5)}
+    stages["calculate_job_match_score"] = (
+        lambda: jobs,
+        lambda jobs: [testapp.calculate_job_match_score(job, resume, motivation) for job in jobs],
+        len(jobs)
+    )
+    stages["score_jobs"] = (
+        lambda: jobs,
+        lambda jobs: testapp.score_jobs(jobs, resume, motivation),
+        len(jobs)
+    )
+    # The app scores one results page at a time
+    page_jobs = jobs[:testapp.DICE_PAGE_SIZE]
+    stages["score_jobs.page"] = (
+        lambda: page_jobs,
+        lambda jobs: testapp.score_jobs(jobs, resume, motivation),
+        len(page_jobs)
+    )
+
+    # Semantic ranking over a few thousand distinct postings
+    many_jobs = [
+        dict(job, **{"Apply Link": f"{job['Apply Link']}-{i}", "Description": f"{job['Description']} {career_goals_text(3, seed=i)}"})
+        for i in range(100) for job in sample_jobs(fixture_pages)
+    ]
+    resume_text = testapp.resume_vector_text(resume, motivation)
+    stages["semantic_index_build"] = (
+        lambda: many_jobs,
+        lambda jobs: testapp.SemanticIndex(cache=testapp.JobVectorCache()).add(jobs),
+        len(many_jobs)
+    )
+    warm_index = testapp.SemanticIndex(cache=testapp.JobVectorCache())
+    warm_index.add(many_jobs)
+    warm_index.top_k(resume_text)
+    stages["semantic_top_k"] = (lambda: resume_text, lambda text: warm_index.top_k(text, 10), len(many_jobs))
+    return stages
+
+def measure(setup, fn, items, repeat, min_time):
+    # Repeats calls until both `repeat` samples and `min_time` seconds are reached
+    fn(setup())
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < repeat or time.perf_counter() - started < min_time:
+        arg = setup()
+        start = time.perf_counter()
+        fn(arg)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    median = timings[len(timings) // 2]
+
+    arg = setup()
+    tracemalloc.start()
+    try:
+        fn(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "median_ms": median * 1000,
+        "throughput": items / median if median else 0.0,
+        "peak_kb": peak / 1024,
+        "samples": len(timings)
+    }
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get("stages", {}).get(name)
+        if previous is None:
+            continue
+        slower = result["median_ms"] / previous["median_ms"] - 1 if previous["median_ms"] else 0.0
+        heavier = result["peak_kb"] / previous["peak_kb"] - 1 if previous["peak_kb"] else 0.0
+        result["vs_baseline"] = f"{slower:+.0%} time, {heavier:+.0%} memory"
+        if slower > tolerance or heavier > tolerance:
+            regressions.append(name)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark each stage of the resume/job matching pipeline")
+    parser.add_argument("--stage", action="append", help="Only run stages whose name starts with this (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5, help="Minimum timed samples per stage")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Minimum seconds of timed samples per stage")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown/memory growth before flagging")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero when any stage regressed")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    stages = build_stages()
+    if args.stage:
+        stages = {name: stage for name, stage in stages.items() if name.startswith(tuple(args.stage))}
+        if not stages:
+            sys.exit(f"No stages match {args.stage}")
+
+    results = {}
+    for name, (setup, fn, items) in stages.items():
+        results[name] = measure(setup, fn, items, args.repeat, args.min_time)
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance) if baseline else []
+
+    print(f"{'stage':<40} {'median':>10} {'throughput':>14} {'peak mem':>10}  vs baseline")
+    for name, result in results.items():
+        print(f"{name:<40} {result['median_ms']:8.2f}ms {result['throughput']:10.1f}/sec "
+              f"{result['peak_kb']:8.0f}KB  {result.get('vs_baseline', '-')}")
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "stages": results
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        if args.stage and os.path.exists(args.baseline):
+            # Partial runs only replace the stages they measured
+            with open(args.baseline, encoding="utf-8") as f:
+                previous = json.load(f)
+            report["stages"] = {**previous.get("stages", {}), **results}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    if regressions:
+        print(f"Regressed beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        if args.check:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
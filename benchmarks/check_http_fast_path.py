@@ -0,0 +1,78 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(ROOT))
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+os.environ.setdefault("HOST_MIN_INTERVAL", "0")
+
+import requests
+import testapp
+from stub_dice import StubDice, fixture
+
+# The HTTP fast path against a local stub serving the recorded Dice pages: what
+# scrape_dice_http returns for full, empty and failed responses, and when
+# fetch_dice_jobs falls back to the browser. Exits non-zero on a failed check.
+#
+#   python benchmarks/check_http_fast_path.py
+
+RESULTS_PAGE = fixture("dice_software_engineer_page1.html")
+EMPTY_PAGE = fixture("dice_no_results.html")
+
+def route(query, page):
+    if query == "Software Engineer":
+        return 200, RESULTS_PAGE
+    if query == "Missing":
+        return 404, "<html>Not found</html>"
+    if query == "Broken":
+        return 503, "<html>Unavailable</html>"
+    return 200, EMPTY_PAGE
+
+failures = []
+
+def check(condition, message):
+    print(f"{'ok  ' if condition else 'FAIL'} {message}")
+    if not condition:
+        failures.append(message)
+
+def main():
+    expected = testapp.parse_dice_cards(RESULTS_PAGE, "Software Engineer")
+    browser_calls = []
+
+    def fake_browser(job_role, driver=None, preferred_location="", preferred_salary="", base_url=None, page=1):
+        browser_calls.append(job_role)
+        return [{"Title": "from browser"}]
+
+    testapp.scrape_dice_browser = fake_browser
+    # A session without urllib3 retries, so the 503 case doesn't sit through backoff
+    session = requests.Session()
+
+    with StubDice(route) as stub:
+        testapp.DICE_BASE_URL = stub.base_url
+
+        jobs = testapp.scrape_dice_http("Software Engineer", base_url=stub.base_url, session=session, page=2)
+        check(len(jobs) == len(expected) > 0 and jobs == expected, f"results page parses to the fixture's {len(expected)} cards")
+        check(stub.requests[-1]["page"] == 2, "page number reaches the server")
+        check(testapp.scrape_dice_http("Nothing Here", base_url=stub.base_url, session=session) == [], "empty results page gives no jobs")
+        check(testapp.scrape_dice_http("Missing", base_url=stub.base_url, session=session) == [], "404 gives no jobs instead of raising")
+        check(testapp.scrape_dice_http("Broken", base_url=stub.base_url, session=session) == [], "503 gives no jobs instead of raising")
+
+        for role, use_browser in [("Software Engineer", False), ("Nothing Here", True), ("Missing", True)]:
+            browser_calls.clear()
+            jobs = testapp.fetch_dice_jobs(role)
+            fell_back = browser_calls == [role]
+            check(fell_back == use_browser and (jobs == [{"Title": "from browser"}]) == use_browser,
+                  f"fetch_dice_jobs({role!r}) {'falls back to' if use_browser else 'skips'} the browser")
+
+        testapp.HTTP_FAST_PATH = False
+        browser_calls.clear()
+        served = len(stub.requests)
+        testapp.fetch_dice_jobs("Software Engineer")
+        check(browser_calls == ["Software Engineer"] and len(stub.requests) == served,
+              "with HTTP_FAST_PATH off only the browser is used")
+
+    print(f"{len(failures)} failed")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
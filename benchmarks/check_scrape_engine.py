@@ -0,0 +1,178 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(ROOT))
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+os.environ.setdefault("HOST_MIN_INTERVAL", "0")
+# stream_role_matches retries failed pages with the default backoff
+os.environ.setdefault("ASYNC_SCRAPE_BACKOFF", "0.01")
+
+import requests
+import testapp
+from stub_dice import StubDice, fixture
+
+# AsyncScrapeEngine and stream_role_matches against a local stub serving the recorded
+# Dice pages, through the engine's injected fetch: the bounded task queue, the
+# per-domain limit, retries with backoff, stopping at a role's first empty page, carrying
+# on past pages that keep failing and cancelling the scrapes when the result generator
+# is closed. Exits non-zero on a failed check.
+#
+#   python benchmarks/check_scrape_engine.py
+
+RESULTS_PAGE = fixture("dice_software_engineer_page1.html")
+EMPTY_PAGE = fixture("dice_no_results.html")
+SLOW = 0.1
+
+class Route:
+    # "Flaky" fails with a 503 until it has been asked `failures` times; "Short" runs
+    # out of results after page 2; "Broken" fails from page 3 on and "Down" on every
+    # page; every other query has results on every page
+    def __init__(self, failures=0, delay=0.0):
+        self.failures = failures
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, query, page):
+        if query == "Flaky":
+            with self._lock:
+                self.calls += 1
+                if self.calls <= self.failures:
+                    return 503, "<html>Unavailable</html>"
+        if query == "Down" or (query == "Broken" and page > 2):
+            return 503, "<html>Unavailable</html>"
+        if query == "Short" and page > 2:
+            return 200, EMPTY_PAGE, self.delay
+        return 200, RESULTS_PAGE, self.delay
+
+failures = []
+
+def check(condition, message):
+    print(f"{'ok  ' if condition else 'FAIL'} {message}")
+    if not condition:
+        failures.append(message)
+
+def stub_fetch(session):
+    # What fetch_scrape_task does minus the caches: raise on HTTP errors so the engine retries
+    def fetch(task):
+        url = testapp.build_dice_url(task.role, task.location, task.salary, page=task.page)
+        return testapp.parse_dice_cards(testapp.fetch_dice_html(url, session), task.role)
+    return fetch
+
+def check_bounded_queue(session):
+    with StubDice(Route()) as stub:
+        testapp.DICE_BASE_URL = stub.base_url
+        pulled = [0]
+        started = [0]
+        ahead = []
+        fetch = stub_fetch(session)
+
+        def source():
+            for page in range(1, 41):
+                pulled[0] += 1
+                yield testapp.ScrapeTask("Software Engineer", "", "", page)
+
+        def counting_fetch(task):
+            started[0] += 1
+            ahead.append(pulled[0] - started[0])
+            return fetch(task)
+
+        engine = testapp.AsyncScrapeEngine(fetch=counting_fetch, workers=2, queue_size=4, per_domain=2)
+        completed = asyncio.run(engine.run(source()))
+        check(len(completed) == 40 and all(error is None for _, _, error in completed), "all 40 tasks complete")
+        # Tasks pulled but not yet started sit in the queue, in a worker's hands or in the producer's
+        check(max(ahead) <= 4 + 2 + 1, f"source is pulled at most queue size ahead of the workers (max {max(ahead)})")
+
+def check_per_domain_limit(session):
+    with StubDice(Route(delay=SLOW)) as stub:
+        testapp.DICE_BASE_URL = stub.base_url
+        tasks = [testapp.ScrapeTask("Software Engineer", "", "", page) for page in range(1, 13)]
+        engine = testapp.AsyncScrapeEngine(fetch=stub_fetch(session), workers=6, per_domain=2)
+        asyncio.run(engine.run(tasks))
+        check(stub.max_in_flight() == 2, f"6 workers keep 2 requests in flight against one host ({stub.max_in_flight()})")
+
+def check_retries(session):
+    with StubDice(Route(failures=2)) as stub:
+        testapp.DICE_BASE_URL = stub.base_url
+        engine = testapp.AsyncScrapeEngine(fetch=stub_fetch(session), retries=2, backoff=0.2, backoff_max=1.0)
+        started = time.monotonic()
+        [(_, result, error)] = asyncio.run(engine.run([testapp.ScrapeTask("Flaky", "", "", 1)]))
+        elapsed = time.monotonic() - started
+        check(error is None and len(result) == 20 and len(stub.requests) == 3, "two 503s are retried and the third attempt succeeds")
+        # Jittered backoff sleeps at least half of 0.2 s, then half of 0.4 s
+        check(elapsed >= 0.3, f"retries back off exponentially ({elapsed:.2f}s)")
+
+    with StubDice(Route(failures=5)) as stub:
+        testapp.DICE_BASE_URL = stub.base_url
+        engine = testapp.AsyncScrapeEngine(fetch=stub_fetch(session), retries=1, backoff=0.01)
+        [(_, result, error)] = asyncio.run(engine.run([testapp.ScrapeTask("Flaky", "", "", 1)]))
+        check(isinstance(error, requests.HTTPError) and result is None and len(stub.requests) == 2,
+              "a task still failing after its retries reports the last error")
+
+def unscored(jobs):
+    for job in jobs:
+        job["match_score"] = 0
+    return jobs
+
+def check_stop_on_empty_page(session):
+    with StubDice(Route()) as stub:
+        testapp.DICE_BASE_URL = stub.base_url
+        batches = list(testapp.stream_role_matches(["Short"], unscored, max_jobs=100, max_pages=5,
+                                                   fetch=stub_fetch(session)))
+        pages = sorted(request["page"] for request in stub.requests)
+        check(len(batches) == 2, f"pages after the first empty one are not yielded ({len(batches)} batches)")
+        check(5 not in pages, f"paging stops once a page comes back empty (requested {pages})")
+
+def check_failed_pages(session):
+    with StubDice(Route()) as stub:
+        testapp.DICE_BASE_URL = stub.base_url
+        batches = list(testapp.stream_role_matches(["Software Engineer", "Broken"], unscored, max_jobs=100,
+                                                   max_pages=5, fetch=stub_fetch(session)))
+        roles = [role for role, _ in batches]
+        broken_pages = sorted({request["page"] for request in stub.requests if request["query"] == "Broken"})
+        check(roles.count("Software Engineer") == 5 and roles.count("Broken") == 2,
+              f"a page failing after its retries doesn't end the search ({len(batches)} batches)")
+        check(broken_pages[-1] <= 3 + testapp.DICE_PAGE_CONCURRENCY,
+              f"paging a role stops soon after its failed page (requested {broken_pages})")
+
+    with StubDice(Route()) as stub:
+        testapp.DICE_BASE_URL = stub.base_url
+        try:
+            list(testapp.stream_role_matches(["Down"], unscored, max_jobs=100, max_pages=5, fetch=stub_fetch(session)))
+            error = None
+        except requests.HTTPError as e:
+            error = e
+        check(error is not None, "the search raises when no page came back at all")
+
+def check_cancellation(session):
+    roles = [f"Role {i}" for i in range(6)]
+    with StubDice(Route(delay=SLOW)) as stub:
+        testapp.DICE_BASE_URL = stub.base_url
+        batches = testapp.stream_role_matches(roles, unscored, max_jobs=100, max_pages=5, max_workers=2,
+                                              fetch=stub_fetch(session))
+        next(batches)
+        batches.close()
+        closed = time.monotonic()
+        time.sleep(5 * SLOW)
+        late = [request for request in stub.requests if request["started"] > closed + SLOW / 2]
+        check(not late and len(stub.requests) < len(roles) * 5,
+              f"closing the generator stops new scrapes ({len(stub.requests)} of {len(roles) * 5} pages fetched, {len(late)} after close)")
+
+def main():
+    # A session without urllib3 retries, so only the engine retries
+    session = requests.Session()
+    check_bounded_queue(session)
+    check_per_domain_limit(session)
+    check_retries(session)
+    check_stop_on_empty_page(session)
+    check_failed_pages(session)
+    check_cancellation(session)
+    print(f"{len(failures)} failed")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
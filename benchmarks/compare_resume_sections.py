@@ -0,0 +1,153 @@
+import argparse
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(ROOT))
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+import testapp
+from corpus import resume_lines
+
+# Section-based resume fields: the original per-field regexes versus the single-pass
+# segmentation, over resumes whose section headers carry a prefix ("Technical Skills").
+# Exits non-zero when a field differs.
+#
+#   python benchmarks/compare_resume_sections.py --seeds 50
+
+HEADER_VARIANTS = [
+    {},
+    {"Skills": "Technical Skills", "Profile": "Professional Profile", "Details": "Contact Details"},
+    {"Skills": "Core Skills", "Languages": "Spoken Languages", "Education": "Higher Education"},
+    {"Profile": "Personal Profile", "Languages": "Other Languages"}
+]
+
+SAMPLES = [
+    # A Details header followed directly by the country line
+    "Jane Doe\nContact Details\nUnited States\njane@example.com\nProfessional Profile\n"
+    "Backend engineer with 7 years of experience.\nEmployment History\nSoftware Engineer, Acme, Seattle\n"
+    "January 2020 - PRESENT\n\nTechnical Skills\nPython\nDocker\n\nLanguages\nEnglish\n",
+    # Summary instead of Profile
+    "John Roe\nDetails\nAustin, TX\nProfessional Summary\nData engineer building pipelines.\n\n"
+    "Key Skills\nSQL\nSpark\nAirflow\n\nEducation\nMaster's in Data Science\n",
+    # A job description line ending in a header word between two jobs
+    "Ann Lee\nDetails\nDenver, CO\nProfile\nPlatform engineer.\nEmployment History\n"
+    "Senior Engineer, Initech, Denver\nMarch 2021 - PRESENT\nBuilt services. Gained AWS Experience\n"
+    "Engineer, Globex, Boulder\nJune 2017 - February 2021\nMaintained billing.\nEducation\nBachelor's in Physics\n",
+    # A free-text skill ending in "Skills", followed by more free-text skills
+    "Sam Park\nDetails\nBoston, MA\nProfile\nProduct-minded developer.\nEmployment History\n"
+    "Developer, Hooli, Boston\nMay 2019 - PRESENT\n\nSkills\nPython\nStrong Communication Skills\n"
+    "Stakeholder Management\nTechnical Writing\n\nLanguages\nEnglish\n"
+]
+
+SKILL_KEYWORDS = testapp.SKILL_KEYWORDS
+QUALIFICATION_KEYWORDS = testapp.QUALIFICATION_KEYWORDS
+COMMON_LANGUAGES = testapp.COMMON_LANGUAGES
+
+def original_location(text):
+    lines = text.split("\n")
+    location_section_start = 0
+    for i, line in enumerate(lines):
+        if "Details" in line:
+            location_section_start = i
+            break
+    for i in range(location_section_start, min(location_section_start + 10, len(lines))):
+        if lines[i] in ["United States", "USA", "U.S.", "U.S.A."]:
+            city_line = i - 1 if i > 0 else 0
+            return f"{lines[city_line]}, {lines[i]}"
+    city_state_pattern = re.search(r"([A-Za-z\s]+),?\s+([A-Za-z\s]+)", text[:500])
+    if city_state_pattern:
+        return city_state_pattern.group(0)
+    return "Location Not Found"
+
+def original_skills(text):
+    skills_section_match = re.search(r"Skills\n(.*?)(?:\n\n|\nProfile|\nEmployment)", text, re.DOTALL)
+    skills_text = skills_section_match.group(1) if skills_section_match else text
+    found_skills = [skill for skill in SKILL_KEYWORDS if re.search(rf"\b{re.escape(skill)}(?!\w)", text, re.IGNORECASE)]
+    additional_skills = [line.strip() for line in skills_text.split("\n") if line.strip() and len(line.strip()) > 2]
+    return list(set(found_skills + additional_skills))
+
+def original_languages(text):
+    languages_section = re.search(r"Languages\n(.*?)(?:\n\n|\nEducation|\nEmployment)", text, re.DOTALL)
+    if languages_section:
+        return [lang.strip() for lang in languages_section.group(1).split("\n") if lang.strip()]
+    found_languages = [lang for lang in COMMON_LANGUAGES if re.search(rf"\b{lang}\b", text)]
+    return found_languages if found_languages else ["Not Found"]
+
+def original_qualifications(text):
+    education_section = re.search(r"Education\n(.*?)(?:\n\n|$)", text, re.DOTALL)
+    if education_section:
+        education_entries = [line.strip() for line in education_section.group(1).split("\n") if line.strip()
+                             and any(keyword in line for keyword in ["Bachelor", "Master", "PhD", "Degree"])]
+        if education_entries:
+            return education_entries
+    found_qualifications = [qual for qual in QUALIFICATION_KEYWORDS if re.search(rf"\b{re.escape(qual)}(?!\w)", text, re.IGNORECASE)]
+    return list(set(found_qualifications)) if found_qualifications else ["Not Found"]
+
+def original_employment_history(text):
+    employment_section = re.search(r"Employment History\n(.*?)(?:\nEducation|\n\nEducation|$)", text, re.DOTALL | re.IGNORECASE)
+    if not employment_section:
+        return ["Employment history not found"]
+    employment_text = employment_section.group(1)
+    job_pattern = re.findall(r"(.*?),\s+(.*?),\s+(.*?)\n(\w+\s+\d{4})\s*[—–-]\s*(\w+\s+\d{4}|PRESENT)",
+                             employment_text, re.IGNORECASE | re.MULTILINE)
+    if not job_pattern:
+        job_pattern = re.findall(r"(.*?),\s+(.*?)\n(\w+\s+\d{4})\s*[—–-]\s*(\w+\s+\d{4}|PRESENT)",
+                                 employment_text, re.IGNORECASE | re.MULTILINE)
+    if not job_pattern:
+        return ["Could not parse employment details"]
+    return [f"{job[0]} at {job[1]}, {job[2]} ({job[3]} - {job[4]})" if len(job) == 5 else
+            f"{job[0]} at {job[1]} ({job[2]} - {job[3]})" for job in job_pattern]
+
+def original_profile_summary(text):
+    profile_section = re.search(r"Profile\n(.*?)(?:\nEmployment|\n\nEmployment)", text, re.DOTALL)
+    if profile_section:
+        profile_text = profile_section.group(1).strip()
+        return profile_text[:497] + "..." if len(profile_text) > 500 else profile_text
+    alt_section = re.search(r"(Summary|About)\n(.*?)(?:\n\n|\nSkills|\nExperience)", text, re.DOTALL)
+    if alt_section:
+        return alt_section.group(2).strip()
+    return "Profile summary not found"
+
+# Fields whose original result is an unordered set
+ORIGINALS = {
+    "location": (original_location, False),
+    "skills": (original_skills, True),
+    "languages": (original_languages, False),
+    "qualifications": (original_qualifications, True),
+    "employment_history": (original_employment_history, False),
+    "profile_summary": (original_profile_summary, False)
+}
+
+def compare(text, label):
+    parsed = testapp.parse_resume_text(text)
+    mismatches = 0
+    for field, (original, unordered) in ORIGINALS.items():
+        expected, actual = original(text), parsed[field]
+        if unordered:
+            expected, actual = sorted(expected), sorted(actual)
+        if expected != actual:
+            mismatches += 1
+            print(f"{label}: {field} differs\n  original: {expected!r}\n  current:  {actual!r}")
+    return mismatches
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare section-based resume fields with the original extractors")
+    parser.add_argument("--seeds", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=2)
+    args = parser.parse_args()
+
+    mismatches = checked = 0
+    for headers in HEADER_VARIANTS:
+        for seed in range(args.seeds):
+            mismatches += compare("\n".join(resume_lines(args.pages, seed, headers)), f"seed {seed} {headers or 'plain'}")
+            checked += 1
+    for i, sample in enumerate(SAMPLES):
+        mismatches += compare(sample, f"sample {i}")
+        checked += 1
+    print(f"{checked} resumes, {mismatches} field mismatches")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import io
+import random
+
+# Synthetic resume corpus for the benchmarks. Resumes follow the section layout
+# the parser expects and are rendered to PDF without any extra dependencies.
+
+FIRST_NAMES = ["Ava", "Liam", "Maya", "Noah", "Zara", "Omar", "Priya", "Lucas", "Hana", "Diego"]
+LAST_NAMES = ["Khan", "Smith", "Garcia", "Chen", "Okafor", "Novak", "Patel", "Silva", "Kim", "Moreau"]
+CITIES = ["Seattle", "Austin", "Boston", "Denver", "Chicago", "Atlanta"]
+SKILLS = ["Python", "Django", "SQL", "AWS", "Docker", "Kubernetes", "React", "TypeScript", "Spark",
+          "Machine Learning", "Terraform", "Linux", "Git", "Agile", "Tableau", "C++", "Node.js"]
+TITLES = ["Software Engineer", "Senior Data Engineer", "Lead Architect", "Principal Analyst",
+          "Engineering Manager", "DevOps Engineer"]
+COMPANIES = ["Acme", "Globex", "Initech", "Hooli", "Umbrella", "Stark Industries"]
+SENTENCES = [
+    "Designed and operated distributed services handling millions of requests per day.",
+    "Led a team of engineers delivering data pipelines on cloud infrastructure.",
+    "Improved deployment frequency by automating build and release workflows.",
+    "Partnered with product and design to ship customer facing features.",
+    "Mentored junior engineers and ran architecture reviews.",
+    "Reduced infrastructure cost by tuning storage and compute usage."
+]
+LINES_PER_PAGE = 50
+
+def resume_lines(pages, seed=0, headers=None):
+    # headers maps a section header to the text used for it, e.g. {"Skills": "Technical Skills"}
+    header = lambda name: (headers or {}).get(name, name)
+    rng = random.Random(seed)
+    city = rng.choice(CITIES)
+    lines = [
+        f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        header("Details"),
+        city,
+        "United States",
+        f"(555) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+        f"candidate{seed}@example.com",
+        header("Profile"),
+        f"{rng.choice(TITLES)} with {rng.randint(3, 15)} years of experience. I am looking for a senior software engineer role in {city}.",
+        header("Employment History")
+    ]
+    target = pages * LINES_PER_PAGE - 12
+    year = 2024
+    while len(lines) < target:
+        lines.append(f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)}, {rng.choice(CITIES)}")
+        lines.append(f"January {year - 2} - December {year}")
+        lines.extend(rng.sample(SENTENCES, 3))
+        year -= 2
+    lines.extend([header("Education"), f"Master's in Computer Science, University of {city}, {year}",
+                  "Bachelor's in Engineering", "", header("Skills")])
+    lines.extend(rng.sample(SKILLS, 8))
+    lines.extend(["", header("Languages"), "English", "Spanish"])
+    return lines
+
+def _pdf_escape(line):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def render_pdf(lines):
+    # Minimal single-font PDF writer: one text object per page, LINES_PER_PAGE lines each
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page_lines in pages:
+        body = "BT /F1 10 Tf 14 TL 50 790 Td " + " ".join(f"({_pdf_escape(line)}) '" for line in page_lines) + " ET"
+        stream = body.encode("cp1252", "replace")
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n" + stream.decode("cp1252") + "\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(f"{number} 0 obj\n{obj}\nendobj\n".encode("cp1252"))
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for offset in offsets:
+        out.write(f"{offset:010d} 00000 n \n".encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return out.getvalue()
+
+def render_docx(lines):
+    from docx import Document
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+def named_stream(data, name):
+    stream = io.BytesIO(data)
+    stream.name = name
+    return stream
+
+GOAL_SENTENCES = [
+    "I am looking for a senior software engineer role in Seattle.",
+    "Long term I want to become a principal data scientist.",
+    "I prefer remote work but would consider hybrid near Boston, MA.",
+    "I am interested in the fintech and healthcare industry.",
+    "Open to a backend developer position at a startup.",
+    "Ideally based in the Bay Area with a flexible schedule."
+]
+
+def career_goals_text(sentences, seed=0):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(GOAL_SENTENCES) for _ in range(sentences))
@@ -0,0 +1,64 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Local stand-in for Dice's search pages, serving the recorded fixtures. A route
+# function maps (query, page) to (status, body) or (status, body, delay seconds);
+# every request is logged with its start and end time.
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+class StubDice:
+    def __init__(self, route):
+        self.route = route
+        self.requests = []
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                started = time.monotonic()
+                params = parse_qs(urlparse(self.path).query)
+                query, page = params.get("q", [""])[0], int(params.get("page", ["1"])[0])
+                status, body, *delay = stub.route(query, page)
+                if delay:
+                    time.sleep(delay[0])
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+                with stub._lock:
+                    stub.requests.append({"query": query, "page": page, "status": status,
+                                          "started": started, "finished": time.monotonic()})
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def max_in_flight(self):
+        # Most requests the server was handling at the same moment
+        with self._lock:
+            events = sorted([(r["started"], 1) for r in self.requests] + [(r["finished"], -1) for r in self.requests])
+        in_flight = peak = 0
+        for _, change in events:
+            in_flight += change
+            peak = max(peak, in_flight)
+        return peak
@@ -0,0 +1,145 @@
+import argparse
+import glob
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Headless bulk resume parser: parses PDF/DOCX files across a process pool and
+# streams one JSON record per file. The JSONL output doubles as the checkpoint,
+# so re-running the same command skips files that were already parsed.
+#
+#   python bulk_parse.py resumes/ "archive/**/*.docx" --output parsed.jsonl
+#   python bulk_parse.py resumes/ --output parsed.jsonl --parquet parsed.parquet
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+PROGRESS_EVERY = 100
+
+testapp = None
+
+def init_worker():
+    global testapp
+    # Importing the app outside `streamlit run` logs bare-mode warnings we don't need
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+    import testapp as app
+    testapp = app
+
+def parse_one(path):
+    start = time.perf_counter()
+    try:
+        with open(path, "rb") as f:
+            stream = io.BytesIO(f.read())
+        stream.name = os.path.basename(path)
+        parsed = testapp.parse_resume(stream)
+        return {"file": path, "ok": True, "seconds": time.perf_counter() - start, "parsed": parsed}
+    except Exception as e:
+        return {"file": path, "ok": False, "seconds": time.perf_counter() - start,
+                "error": f"{type(e).__name__}: {e}"}
+
+def collect_files(inputs):
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = glob.glob(os.path.join(item, "**", "*"), recursive=True)
+        else:
+            matches = glob.glob(item, recursive=True)
+        files.extend(path for path in matches if path.lower().endswith(SUPPORTED_EXTENSIONS) and os.path.isfile(path))
+    return sorted(set(os.path.abspath(path) for path in files))
+
+def load_checkpoint(output, retry_errors):
+    done = set()
+    if not os.path.exists(output):
+        return done
+    with open(output, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A torn last line from an interrupted run; the file gets parsed again
+                continue
+            if record.get("ok") or not retry_errors:
+                done.add(record["file"])
+    return done
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+def report(label, latencies, processed, failed, started):
+    elapsed = time.perf_counter() - started
+    ordered = sorted(latencies)
+    print(
+        f"{label}: {processed} files ({failed} failed) in {elapsed:.1f}s, "
+        f"{processed / elapsed if elapsed else 0.0:.1f} files/sec, "
+        f"p50 {percentile(ordered, 0.5) * 1000:.0f} ms, p99 {percentile(ordered, 0.99) * 1000:.0f} ms",
+        file=sys.stderr
+    )
+
+def export_parquet(jsonl_path, parquet_path):
+    import pandas as pd
+    # Retried files appear more than once in the log; the latest record wins
+    records = {}
+    with open(jsonl_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            row = {"file": record["file"], "ok": record["ok"], "seconds": record["seconds"],
+                   "error": record.get("error")}
+            row.update(record.get("parsed") or {})
+            records[record["file"]] = row
+    try:
+        pd.DataFrame(list(records.values())).to_parquet(parquet_path, index=False)
+    except ImportError as e:
+        sys.exit(f"Parquet export needs pyarrow or fastparquet installed: {e}")
+    print(f"Wrote {len(records)} rows to {parquet_path}", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse a directory or glob of resumes in parallel")
+    parser.add_argument("inputs", nargs="+", help="Directories (searched recursively) or glob patterns")
+    parser.add_argument("--output", required=True, help="JSONL file to append results to; also the checkpoint")
+    parser.add_argument("--parquet", help="Also export every record in --output to this Parquet file at the end")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--restart", action="store_true", help="Ignore the existing output and start over")
+    parser.add_argument("--retry-errors", action="store_true", help="Parse files that failed last time again")
+    args = parser.parse_args()
+
+    files = collect_files(args.inputs)
+    if args.restart and os.path.exists(args.output):
+        os.remove(args.output)
+    done = load_checkpoint(args.output, args.retry_errors)
+    todo = [path for path in files if path not in done]
+    print(f"{len(files)} resumes found, {len(done)} already parsed, {len(todo)} to go", file=sys.stderr)
+
+    latencies = []
+    processed = failed = 0
+    started = time.perf_counter()
+    with open(args.output, "a", encoding="utf-8") as out, \
+            ProcessPoolExecutor(max_workers=max(1, args.workers), initializer=init_worker) as executor:
+        futures = [executor.submit(parse_one, path) for path in todo]
+        try:
+            for future in as_completed(futures):
+                record = future.result()
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+                processed += 1
+                failed += not record["ok"]
+                latencies.append(record["seconds"])
+                if processed % PROGRESS_EVERY == 0:
+                    report("progress", latencies, processed, failed, started)
+        except KeyboardInterrupt:
+            for future in futures:
+                future.cancel()
+            print("Interrupted; re-run the same command to continue from the checkpoint", file=sys.stderr)
+            raise
+    report("done", latencies, processed, failed, started)
+
+    if args.parquet:
+        export_parquet(args.output, args.parquet)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+# Reverse matching for recruiting: ranks a corpus of resumes parsed by bulk_parse.py
+# against one job posting, given as a JSON file of a scraped job, a key from the
+# local job store, or a title/description on the command line.
+#
+#   python rank_candidates.py parsed.jsonl --job posting.json --top 20
+#   python rank_candidates.py parsed.jsonl --title "Data Engineer" --description-file jd.txt --location "Austin, TX"
+
+def load_job(args, testapp):
+    if args.job:
+        with open(args.job, encoding="utf-8") as f:
+            return json.load(f)
+    if args.job_key:
+        job = testapp.get_job_store().get_jobs([args.job_key]).get(args.job_key)
+        if job is None:
+            sys.exit(f"No job with key {args.job_key} in the job store")
+        return job
+    if not args.title and not args.description_file:
+        sys.exit("Give a posting with --job, --job-key or --title/--description-file")
+    description = ""
+    if args.description_file:
+        with open(args.description_file, encoding="utf-8") as f:
+            description = f.read()
+    return {"Title": args.title or "", "Description": description, "Location": args.location or ""}
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank parsed resumes against one job posting")
+    parser.add_argument("resumes", help="JSONL output of bulk_parse.py")
+    parser.add_argument("--job", help="JSON file holding one scraped job")
+    parser.add_argument("--job-key", help="Key of a job in the local job store")
+    parser.add_argument("--title")
+    parser.add_argument("--description-file")
+    parser.add_argument("--location")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--min-score", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON lines")
+    args = parser.parse_args()
+
+    # Importing the app outside `streamlit run` logs bare-mode warnings we don't need
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+    import testapp
+
+    job = load_job(args, testapp)
+    started = time.perf_counter()
+    index = testapp.CandidateIndex.from_jsonl(args.resumes)
+    built = time.perf_counter()
+    results = index.query(job, k=args.top, min_score=args.min_score)
+    print(f"Indexed {len(index)} resumes in {built - started:.2f}s, ranked in {(time.perf_counter() - built) * 1000:.1f} ms",
+          file=sys.stderr)
+
+    for result in results:
+        if args.json:
+            print(json.dumps(result, ensure_ascii=False))
+        else:
+            years = "?" if result["experience_years"] is None else f"{result['experience_years']:g}"
+            print(f"{result['score']:3d}%  {result['name'] or '-'}  ({result['location'] or '-'}, {years} yrs)  "
+                  f"{', '.join(result['matched_skills'])}  {result['candidate_id']}")
+
+if __name__ == "__main__":
+    main()
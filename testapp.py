@@ -1,18 +1,55 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from PIL import Image
 import base64
 import time
 import re
+import math
 import pdfplumber
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 from docx import Document
 import os
-from bs4 import BeautifulSoup
+import atexit
+import random
+import copy
+import hashlib
+import io
+import json
+import sqlite3
+import queue
+import threading
+import zlib
+import asyncio
+import contextvars
+from bisect import bisect_left, bisect_right
+from html import escape
+from collections import OrderedDict, defaultdict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from urllib.parse import urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 
@@ -24,9 +61,20 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Shared on-disk location for caches and stores that should survive restarts
+CACHE_DIR = os.environ.get("CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+
+# ---------------- Shared Resources ----------------
+
+# Streamlit re-executes this script on every rerun of every session, so module-level
+# objects that are costly to build go through here: built once per process under their
+# name and shared by all sessions. A failed build is not cached and is retried next call.
+@st.cache_resource(show_spinner=False)
+def shared_resource(name, _build):
+    return _build()
+
 # Custom CSS to enhance the UI
-def add_custom_css():
-    st.markdown("""
+CUSTOM_CSS = """
     <style>
         .main-header {
             font-size: 2.5rem;
@@ -182,7 +230,10 @@ def add_custom_css():
             background-color: #E3F2FD;
         }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def add_custom_css():
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # Add logo and app header function
 def show_app_header():
@@ -210,35 +261,453 @@ def show_progress():
                 st.markdown(f'<div style="text-align: center; color: #9E9E9E;">{title}</div>', unsafe_allow_html=True)
     st.markdown('</div>', unsafe_allow_html=True)
 
+# ---------------- Instrumentation ----------------
+
+# Prometheus text exposition of the stage metrics, rewritten every METRICS_FLUSH_INTERVAL
+# seconds (point node_exporter's textfile collector at it) and/or served on METRICS_PORT
+METRICS_FILE = os.environ.get("METRICS_FILE", "")
+METRICS_PORT = int(os.environ.get("METRICS_PORT", "0"))
+METRICS_FLUSH_INTERVAL = float(os.environ.get("METRICS_FLUSH_INTERVAL", "15"))
+METRICS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# The sidebar stage breakdown shows with DEV_PANEL=1 or ?dev=1 in the URL
+DEV_PANEL = os.environ.get("DEV_PANEL", "0") == "1"
+
+class StageMetrics:
+    # Process-wide latency histogram and error counter per stage
+    def __init__(self, buckets=METRICS_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._stages = {}
+
+    def observe(self, stage, seconds, error=False):
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                entry = self._stages[stage] = {"count": 0, "sum": 0.0, "errors": 0, "buckets": [0] * len(self.buckets)}
+            entry["count"] += 1
+            entry["sum"] += seconds
+            entry["errors"] += error
+            index = bisect_left(self.buckets, seconds)
+            if index < len(self.buckets):
+                entry["buckets"][index] += 1
+
+    def prometheus(self):
+        with self._lock:
+            stages = {stage: dict(entry, buckets=list(entry["buckets"])) for stage, entry in self._stages.items()}
+        lines = [
+            "# HELP careercompass_stage_seconds Time spent in each pipeline stage.",
+            "# TYPE careercompass_stage_seconds histogram"
+        ]
+        for stage, entry in sorted(stages.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, entry["buckets"]):
+                cumulative += count
+                lines.append(f'careercompass_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'careercompass_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {entry["count"]}')
+            lines.append(f'careercompass_stage_seconds_sum{{stage="{stage}"}} {entry["sum"]:.6f}')
+            lines.append(f'careercompass_stage_seconds_count{{stage="{stage}"}} {entry["count"]}')
+        lines.append("# HELP careercompass_stage_errors_total Stage calls that raised.")
+        lines.append("# TYPE careercompass_stage_errors_total counter")
+        for stage, entry in sorted(stages.items()):
+            lines.append(f'careercompass_stage_errors_total{{stage="{stage}"}} {entry["errors"]}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        # Write then rename so scrapers never read a half-written file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.prometheus())
+        os.replace(tmp_path, path)
+
+class StageTrace:
+    # Stage timings for a single script run, including work it hands to other threads
+    def __init__(self):
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self.stages = {}
+
+    def add(self, stage, seconds):
+        with self._lock:
+            entry = self.stages.setdefault(stage, {"calls": 0, "total": 0.0, "max": 0.0})
+            entry["calls"] += 1
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+
+    def rows(self):
+        with self._lock:
+            return sorted(
+                ({"Stage": stage, "Calls": entry["calls"], "Total (ms)": round(entry["total"] * 1000, 1),
+                  "Max (ms)": round(entry["max"] * 1000, 1)} for stage, entry in self.stages.items()),
+                key=lambda row: row["Total (ms)"],
+                reverse=True
+            )
+
+# Context variables follow work into asyncio tasks and asyncio.to_thread calls
+CURRENT_STAGE_TRACE = contextvars.ContextVar("current_stage_trace", default=None)
+
+def serve_metrics(metrics, port):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = metrics.prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
+
+@st.cache_resource
+def get_stage_metrics():
+    metrics = StageMetrics()
+    if METRICS_FILE:
+        def flush():
+            while True:
+                time.sleep(METRICS_FLUSH_INTERVAL)
+                try:
+                    metrics.write(METRICS_FILE)
+                except OSError as e:
+                    print("Failed to write metrics file:", e)
+
+        threading.Thread(target=flush, name="metrics-flush", daemon=True).start()
+        atexit.register(metrics.write, METRICS_FILE)
+    if METRICS_PORT:
+        serve_metrics(metrics, METRICS_PORT)
+    return metrics
+
+@contextmanager
+def timed(stage):
+    # Times a block, or a whole function when used as @timed("stage")
+    start = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except Exception:
+        failed = True
+        raise
+    finally:
+        seconds = time.perf_counter() - start
+        get_stage_metrics().observe(stage, seconds, failed)
+        trace = CURRENT_STAGE_TRACE.get()
+        if trace is not None:
+            trace.add(stage, seconds)
+
+def begin_stage_trace():
+    # Searches end in st.rerun, so the run that did the work never renders its own
+    # breakdown; keep the previous run's trace around for the panel
+    st.session_state.last_stage_trace = st.session_state.get("stage_trace")
+    trace = StageTrace()
+    st.session_state.stage_trace = trace
+    CURRENT_STAGE_TRACE.set(trace)
+
+def show_dev_panel():
+    with st.sidebar.expander("Developer: stage timings", expanded=True):
+        for label, trace in [("This run", st.session_state.stage_trace),
+                             ("Previous run", st.session_state.get("last_stage_trace"))]:
+            if trace is None:
+                continue
+            st.markdown(f"**{label}** (started {time.strftime('%H:%M:%S', time.localtime(trace.started))})")
+            st.dataframe(pd.DataFrame(trace.rows()), hide_index=True)
+        # Browser page loads across all sessions of this process
+        page_ready = get_page_ready_metrics().summary()
+        if page_ready["pages"]:
+            st.markdown(
+                f"**Page readiness** ({page_ready['pages']} pages): p50 {page_ready['p50']:.2f}s, "
+                f"p90 {page_ready['p90']:.2f}s, max {page_ready['max']:.2f}s, "
+                f"{page_ready['timeouts']} timed out, {page_ready['empty']} without results"
+            )
+        # Scrape cache counters since this process started
+        cache = get_scrape_cache().stats()
+        st.markdown(
+            f"**Scrape cache** ({cache['entries']} entries): {cache['hits']} fresh hits, "
+            f"{cache['stale_hits']} stale hits, {cache['misses']} misses, {cache['evictions']} evictions"
+        )
+        if PRESCRAPE_ENABLED:
+            scheduler = get_prescrape_scheduler()
+            status = scheduler.status()
+            now = time.time()
+            st.markdown(f"**Pre-scraping** ({len(status)} of {len(scheduler.targets)} targets refreshed)")
+            if status:
+                st.dataframe(pd.DataFrame([
+                    {"Role": role, "Location": location or "Any", "Refreshed (min ago)": round((now - entry["finished_at"]) / 60),
+                     "Pages": entry["pages"], "Jobs": entry["jobs"], "Error": entry["error"] or ""}
+                    for (role, location), entry in sorted(status.items())
+                ]), hide_index=True)
+
+# ---------------- Keyword Matching ----------------
+
+class KeywordMatcher:
+    # Case-insensitive whole-word matcher for a fixed vocabulary. The keywords are
+    # folded into a trie-shaped regex once, so matching is a single left-to-right
+    # scan of the text no matter how large the vocabulary grows.
+    def __init__(self, keywords):
+        self.keywords = list(dict.fromkeys(keywords))
+        self._canonical = {}
+        for keyword in self.keywords:
+            self._canonical.setdefault(keyword.lower(), keyword)
+        self._order = {keyword: i for i, keyword in enumerate(self.keywords)}
+        # Word boundaries are lookarounds so keywords like C++, C# and Node.js work
+        self.pattern = re.compile(r"(?<!\w)(?:" + self._trie_pattern(self._canonical) + r")(?!\w)", re.IGNORECASE)
+        # A match consumes its text, so remember which shorter keywords a longer one contains
+        # (e.g. "AI" inside "AI model Training")
+        self._implied = {}
+        for lowered, keyword in self._canonical.items():
+            words = lowered.split()
+            contained = {
+                self._canonical[" ".join(words[i:j])]
+                for i in range(len(words))
+                for j in range(i + 1, len(words) + 1)
+                if (j - i) < len(words) and " ".join(words[i:j]) in self._canonical
+            }
+            if contained:
+                self._implied[keyword] = contained
+
+    @staticmethod
+    def _trie_pattern(words):
+        trie = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        def build(node):
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            if "" in node:
+                return "(?:" + body + ")?"
+            return body
+
+        return build(trie)
+
+    def find_all(self, text):
+        found = set()
+        for match in self.pattern.finditer(text):
+            keyword = self._canonical[match.group(0).lower()]
+            found.add(keyword)
+            found.update(self._implied.get(keyword, ()))
+        return sorted(found, key=self._order.__getitem__)
+
 # ---------------- Resume Parsing Functions ----------------
-def parse_resume(file):
+def extract_resume_text(file):
     file_extension = file.name.split('.')[-1].lower()
     if file_extension == 'pdf':
-        text = extract_text_from_pdf(file)
+        return extract_text_from_pdf(file)
     elif file_extension == 'docx':
-        text = extract_text_from_docx(file)
+        return extract_text_from_docx(file)
     else:
         raise ValueError("Unsupported file format. Please upload a PDF or DOCX file.")
-    
+
+def parse_resume_text(text):
+    # Find the section boundaries once and let every extractor work on its own slice
+    sections = segment_sections(text)
     parsed_data = {
-        "name": extract_name(text),
-        "email": extract_email(text),
-        "phone": extract_phone(text),
-        "location": extract_location(text),
-        "skills": extract_skills(text),
-        "languages": extract_languages(text),
-        "experience": extract_experience(text),
-        "qualifications": extract_qualifications(text),
-        "employment_history": extract_employment_history(text),
-        "profile_summary": extract_profile_summary(text)
+        "name": extract_name(text, sections),
+        "email": extract_email(text, sections),
+        "phone": extract_phone(text, sections),
+        "location": extract_location(text, sections),
+        "skills": extract_skills(text, sections),
+        "languages": extract_languages(text, sections),
+        "experience": extract_experience(text, sections),
+        "qualifications": extract_qualifications(text, sections),
+        "employment_history": extract_employment_history(text, sections),
+        "profile_summary": extract_profile_summary(text, sections)
     }
     return parsed_data
 
-def extract_text_from_pdf(file):
+@timed("parse_resume")
+def parse_resume(file):
+    return parse_resume_text(extract_resume_text(file))
+
+# ---------------- Resume Cache ----------------
+
+RESUME_CACHE_SIZE = int(os.environ.get("RESUME_CACHE_SIZE", "64"))
+# Resumes hold personal data, so writing them to disk is opt-in
+RESUME_CACHE_PERSIST = os.environ.get("RESUME_CACHE_PERSIST", "0") == "1"
+
+class ResumeCache:
+    # Content-addressed LRU of extracted text and parsed fields, optionally mirrored to disk
+    def __init__(self, max_entries=RESUME_CACHE_SIZE, directory=None):
+        self.max_entries = max(1, max_entries)
+        self.directory = directory
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.directory:
+            try:
+                with open(os.path.join(self.directory, f"{key}.json"), encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+            self._remember(key, entry)
+            return entry
+        return None
+
+    def put(self, key, entry):
+        self._remember(key, entry)
+        if self.directory:
+            path = os.path.join(self.directory, f"{key}.json")
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(path + ".tmp", path)
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+@st.cache_resource
+def get_resume_cache():
+    return ResumeCache(directory=os.path.join(CACHE_DIR, "resumes") if RESUME_CACHE_PERSIST else None)
+
+def parse_resume_cached(file):
+    data = file.getvalue() if hasattr(file, "getvalue") else file.read()
+    file_extension = file.name.split('.')[-1].lower()
+    key = f"{hashlib.sha256(data).hexdigest()}-{file_extension}"
+    cache = get_resume_cache()
+    entry = cache.get(key)
+    if entry is None:
+        stream = io.BytesIO(data)
+        stream.name = file.name
+        # Same stage as parse_resume, which this inlines to keep the extracted text
+        with timed("parse_resume"):
+            text = extract_resume_text(stream)
+            entry = {"text": text, "parsed": parse_resume_text(text)}
+        cache.put(key, entry)
+    # Hand out a copy so callers can't corrupt the shared entry
+    return copy.deepcopy(entry["parsed"])
+
+# One of "layout" (pdfplumber's full layout analysis), "simple" (pdfplumber's
+# extract_text_simple) or "pdfium" (raw text stream via pypdfium2, no layout)
+PDF_TEXT_BACKEND = os.environ.get("PDF_TEXT_BACKEND", "layout")
+RESUME_SECTION_HEADERS = ["Details", "Profile", "Summary", "About", "Skills", "Employment History",
+                          "Experience", "Education", "Languages"]
+# A section header is a line holding just the header name, in any case ("SKILLS"), or
+# a short title ending in it ("Technical Skills", "Contact Details"). Titles are at most
+# PREFIXED_HEADER_MAX_WORDS words, carry no sentence punctuation and are case-sensitive,
+# so "Built services. Gained AWS Experience" stays a line of the section it is in.
+SECTION_HEADER_LINE_PATTERN = re.compile(
+    r"^[ \t]*(" + "|".join(re.escape(h) for h in RESUME_SECTION_HEADERS) + r")[ \t]*$",
+    re.MULTILINE | re.IGNORECASE
+)
+# Unanchored and case-sensitive, so the regex engine can skip ahead on the headers' first letters
+SECTION_HEADER_SUFFIX_PATTERN = re.compile(
+    r"(" + "|".join(re.escape(h) for h in RESUME_SECTION_HEADERS) + r")[ \t]*$",
+    re.MULTILINE
+)
+SECTION_HEADER_NAMES = {h.lower(): h for h in RESUME_SECTION_HEADERS}
+PREFIXED_HEADER_MAX_WORDS = 3
+SENTENCE_PUNCTUATION = frozenset(".,;:!?")
+# Sections that are lists running to the next blank line. Until that blank line a
+# titled line inside them is an entry ("Strong Communication Skills"), not a header.
+RESUME_LIST_SECTIONS = frozenset(["Skills", "Languages", "Education", "Summary", "About"])
+
+def iter_section_headers(text, current=None):
+    # (line start, line end, header name) for every header line, in text order. current
+    # is the section still open where text starts, when scanning a text piece by piece.
+    headers = {}
+    for match in SECTION_HEADER_LINE_PATTERN.finditer(text):
+        headers[match.start()] = (match.end(), SECTION_HEADER_NAMES[match.group(1).lower()], True)
+    for match in SECTION_HEADER_SUFFIX_PATTERN.finditer(text):
+        start = match.start()
+        # The name has to be a whole word, not the tail of "SoftSkills"
+        if start and (text[start - 1].isalnum() or text[start - 1] == "_"):
+            continue
+        line_start = text.rfind("\n", 0, start) + 1
+        if line_start in headers:
+            continue
+        line = text[line_start:match.end()]
+        if len(line.split()) <= PREFIXED_HEADER_MAX_WORDS and SENTENCE_PUNCTUATION.isdisjoint(line):
+            headers[line_start] = (match.end(), SECTION_HEADER_NAMES[match.group(1).lower()], False)
+    body_start = 0
+    for line_start in sorted(headers):
+        end, name, whole_line = headers[line_start]
+        if (not whole_line and current in RESUME_LIST_SECTIONS
+                and text.find("\n\n", max(0, body_start - 1), line_start) == -1):
+            continue
+        current = name
+        body_start = end + 1
+        yield line_start, end, name
+
+def iter_pdf_page_text(file, backend=None):
+    backend = backend or PDF_TEXT_BACKEND
+    if backend == "pdfium":
+        if pdfium is None:
+            raise ValueError("The pdfium backend needs pypdfium2 installed")
+        pdf = pdfium.PdfDocument(file)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                yield textpage.get_text_range().replace("\r\n", "\n")
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        return
+    if backend not in ("layout", "simple"):
+        raise ValueError(f"Unknown PDF text backend: {backend}")
+    with pdfplumber.open(file) as pdf:
+        for page in pdf.pages:
+            # Extract each page exactly once; layout analysis dominates parse time
+            text = page.extract_text() if backend == "layout" else page.extract_text_simple()
+            page.close()
+            yield text
+
+def sections_complete(*headers):
+    # Stop condition for extract_text_from_pdf, fed one page at a time: every header has
+    # been seen and is followed by another section header, so its section can't grow any
+    # more. Each page is scanned once. For callers that only need the leading sections;
+    # the app parses every field, which needs the whole text, so it never stops early.
+    wanted = set(headers)
+    growing = set()
+    state = {"open": None, "joint": ""}
+
+    def complete(page_text):
+        # Pages are joined with "\n"; keep the join in front so a blank line across it still counts
+        text = state["joint"] + "\n" + page_text
+        body_start = 0
+        for _, end, name in iter_section_headers(text, state["open"]):
+            growing.clear()
+            if name in wanted:
+                wanted.discard(name)
+                growing.add(name)
+            state["open"] = name
+            body_start = end + 1
+        if text.find("\n\n", max(0, body_start - 1)) != -1:
+            state["open"] = None
+        state["joint"] = "\n" if page_text.endswith("\n") else ""
+        return not wanted and not growing
+
+    return complete
+
+def extract_text_from_pdf(file, backend=None, stop_when=None):
+    # stop_when(page_text) is called with each new page and ends extraction when it returns True
     try:
-        with pdfplumber.open(file) as pdf:
-            text = "\n".join([page.extract_text() for page in pdf.pages if page.extract_text()])
-        return text.strip()
+        pages = []
+        for page_text in iter_pdf_page_text(file, backend):
+            if not page_text:
+                continue
+            pages.append(page_text)
+            if stop_when and stop_when(page_text):
+                break
+        return "\n".join(pages).strip()
     except Exception as e:
         raise ValueError(f"Error extracting text from PDF: {e}")
 
@@ -250,106 +719,150 @@ def extract_text_from_docx(file):
     except Exception as e:
         raise ValueError(f"Error extracting text from DOCX: {e}")
 
-def extract_name(text):
-    lines = text.split("\n")
-    possible_names = [line for line in lines[:5] if len(line.split()) in [2, 3]]
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+PHONE_PATTERN = re.compile(r"(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}")
+CITY_STATE_PATTERN = re.compile(r"([A-Za-z\s]+),?\s+([A-Za-z\s]+)")
+EMPLOYMENT_WITH_LOCATION_PATTERN = re.compile(
+    r"(.*?),\s+(.*?),\s+(.*?)\n(\w+\s+\d{4})\s*[—–-]\s*(\w+\s+\d{4}|PRESENT)", re.IGNORECASE | re.MULTILINE
+)
+EMPLOYMENT_PATTERN = re.compile(
+    r"(.*?),\s+(.*?)\n(\w+\s+\d{4})\s*[—–-]\s*(\w+\s+\d{4}|PRESENT)", re.IGNORECASE | re.MULTILINE
+)
+YEARS_OF_EXPERIENCE_PATTERN = re.compile(r"(\d{1,2})\+?\s*years?(?:\s+of\s+experience)?")
+EMPLOYMENT_PERIOD_PATTERN = re.compile(r"(\w+\s+\d{4})\s*[—–-]\s*(\w+\s+\d{4}|PRESENT)", re.IGNORECASE)
+SENIOR_TITLE_PATTERN = re.compile(r"\b(architect|analyst|lead|principal|manager|director|engineer)\b", re.IGNORECASE)
+
+def segment_sections(text):
+    # Single pass over the text: header name -> (start, end) of the body under its
+    # first occurrence. A body runs until the next header or the end of the text.
+    sections = {}
+    current = None
+    body_start = 0
+    for start, end, name in iter_section_headers(text):
+        if current is not None and current not in sections:
+            sections[current] = (body_start, max(body_start, start - 1))
+        current = name
+        body_start = min(len(text), end + 1)
+    if current is not None and current not in sections:
+        sections[current] = (body_start, len(text))
+    return sections
+
+def section_text(text, sections, name, stop_at_blank_line=False):
+    if name not in sections:
+        return None
+    start, end = sections[name]
+    body = text[start:end]
+    if stop_at_blank_line:
+        body = body.split("\n\n", 1)[0]
+    return body
+
+def extract_name(text, sections=None):
+    lines = text.split("\n", 5)[:5]
+    possible_names = [line for line in lines if len(line.split()) in [2, 3]]
     return possible_names[0] if possible_names else "Unknown"
 
-def extract_email(text):
-    match = re.search(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text)
+def extract_email(text, sections=None):
+    match = EMAIL_PATTERN.search(text)
     return match.group(0) if match else "Not Found"
 
-def extract_phone(text):
-    match = re.search(r"(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", text)
+def extract_phone(text, sections=None):
+    match = PHONE_PATTERN.search(text)
     return match.group(0) if match else "Not Found"
 
-def extract_location(text):
-    lines = text.split("\n")
-    location_section_start = 0
-    for i, line in enumerate(lines):
-        if "Details" in line:
-            location_section_start = i
-            break
-    for i in range(location_section_start, min(location_section_start + 10, len(lines))):
-        if lines[i] in ["United States", "USA", "U.S.", "U.S.A."]:
+def extract_location(text, sections=None):
+    sections = segment_sections(text) if sections is None else sections
+    # Look from the Details header line on when there is one, otherwise at the top of the resume
+    details_start = 0
+    if "Details" in sections:
+        details_start = text.rfind("\n", 0, sections["Details"][0] - 1) + 1
+    lines = text[details_start:].split("\n", 11)[:11]
+    for i, line in enumerate(lines[:10]):
+        if line in ["United States", "USA", "U.S.", "U.S.A."]:
             city_line = i - 1 if i > 0 else 0
-            return f"{lines[city_line]}, {lines[i]}"
-    city_state_pattern = re.search(r"([A-Za-z\s]+),?\s+([A-Za-z\s]+)", text[:500])
+            return f"{lines[city_line]}, {line}"
+    city_state_pattern = CITY_STATE_PATTERN.search(text[:500])
     if city_state_pattern:
         return city_state_pattern.group(0)
     return "Location Not Found"
 
-def extract_skills(text):
-    skill_keywords = [
-        "Python", "Flask", "Django", "Machine Learning", "SQL", "Java", "React", "AWS",
-        "JavaScript", "HTML", "CSS", "TensorFlow", "Pandas", "NumPy", "Docker", "Kubernetes",
-        "Git", "Azure", "Linux", "Node.js", "C#", "C++", "Go", "PHP", "TypeScript", "Tableau", 
-        "Power BI", "Jupyter", "Spark", "Hadoop", "Scala", "Cloud", "Vagrant", "LLMs", "GPT",
-        "Re-enforcement", "Site Reliability", "DevOps", "Microservices", "NOSQL", 
-        "Apache Kafka", "Apache Webserver", "Blockchain", "Performance engineering",
-        "AI model Training", "Data Science", "Feature Engineering", "AI", "Shell Script", 
-        "Intrusion Detection", "Matlab", "R", "Agile", "SDLC"
-    ]
-    skills_section_match = re.search(r"Skills\n(.*?)(?:\n\n|\nProfile|\nEmployment)", text, re.DOTALL)
-    skills_text = skills_section_match.group(1) if skills_section_match else text
-    found_skills = [skill for skill in skill_keywords if re.search(rf"\b{skill}\b", text, re.IGNORECASE)]
+SKILL_KEYWORDS = [
+    "Python", "Flask", "Django", "Machine Learning", "SQL", "Java", "React", "AWS",
+    "JavaScript", "HTML", "CSS", "TensorFlow", "Pandas", "NumPy", "Docker", "Kubernetes",
+    "Git", "Azure", "Linux", "Node.js", "C#", "C++", "Go", "PHP", "TypeScript", "Tableau", 
+    "Power BI", "Jupyter", "Spark", "Hadoop", "Scala", "Cloud", "Vagrant", "LLMs", "GPT",
+    "Re-enforcement", "Site Reliability", "DevOps", "Microservices", "NOSQL", 
+    "Apache Kafka", "Apache Webserver", "Blockchain", "Performance engineering",
+    "AI model Training", "Data Science", "Feature Engineering", "AI", "Shell Script", 
+    "Intrusion Detection", "Matlab", "R", "Agile", "SDLC"
+]
+SKILL_MATCHER = shared_resource("skill_matcher", lambda: KeywordMatcher(SKILL_KEYWORDS))
+
+def extract_skills(text, sections=None):
+    sections = segment_sections(text) if sections is None else sections
+    skills_text = section_text(text, sections, "Skills", stop_at_blank_line=True)
+    if skills_text is None:
+        skills_text = text
+    found_skills = SKILL_MATCHER.find_all(text)
     additional_skills = [line.strip() for line in skills_text.split("\n") if line.strip() and len(line.strip()) > 2]
     all_skills = list(set(found_skills + additional_skills))
     return all_skills
 
-def extract_languages(text):
-    languages_section = re.search(r"Languages\n(.*?)(?:\n\n|\nEducation|\nEmployment)", text, re.DOTALL)
-    if languages_section:
-        languages_text = languages_section.group(1)
+COMMON_LANGUAGES = ["English", "Spanish", "French", "German", "Chinese", "Japanese", 
+                    "Arabic", "Hindi", "Bengali", "Russian", "Portuguese"]
+COMMON_LANGUAGES_PATTERN = re.compile(r"\b(?:" + "|".join(COMMON_LANGUAGES) + r")\b")
+
+def extract_languages(text, sections=None):
+    sections = segment_sections(text) if sections is None else sections
+    languages_text = section_text(text, sections, "Languages", stop_at_blank_line=True)
+    if languages_text is not None:
         languages = [lang.strip() for lang in languages_text.split("\n") if lang.strip()]
         return languages
-    common_languages = ["English", "Spanish", "French", "German", "Chinese", "Japanese", 
-                        "Arabic", "Hindi", "Bengali", "Russian", "Portuguese"]
-    found_languages = [lang for lang in common_languages if re.search(rf"\b{lang}\b", text)]
+    found = set(COMMON_LANGUAGES_PATTERN.findall(text))
+    found_languages = [lang for lang in COMMON_LANGUAGES if lang in found]
     return found_languages if found_languages else ["Not Found"]
 
-def extract_experience(text):
-    years_of_experience = re.findall(r"(\d{1,2})\+?\s*years?(?:\s+of\s+experience)?", text)
+def extract_experience(text, sections=None):
+    years_of_experience = YEARS_OF_EXPERIENCE_PATTERN.findall(text)
     if years_of_experience:
         max_experience = max(map(int, years_of_experience))
         return f"{max_experience} years of experience"
-    employment_pattern = re.findall(r"(\w+\s+\d{4})\s*[—–-]\s*(\w+\s+\d{4}|PRESENT)", text, re.IGNORECASE)
+    employment_pattern = EMPLOYMENT_PERIOD_PATTERN.findall(text)
     if employment_pattern:
         return f"{len(employment_pattern)} employment periods found"
     return "Experience not found"
 
-def extract_qualifications(text):
-    qualification_keywords = [
-        "Bachelor's", "Master's", "PhD", "Degree", "Certification", "Diploma", "BSc", "MSc", 
-        "B.A.", "M.A.", "BTech", "MTech", "MBA", "Engineering", "Architecture", "Computer Science", 
-        "Information Technology", "Data Science", "Machine Learning", "AI", "Software Engineering",
-        "CSSA", "Certified", "Business", "MIS", "University"
-    ]
-    education_section = re.search(r"Education\n(.*?)(?:\n\n|$)", text, re.DOTALL)
-    if education_section:
-        edu_text = education_section.group(1)
+QUALIFICATION_KEYWORDS = [
+    "Bachelor's", "Master's", "PhD", "Degree", "Certification", "Diploma", "BSc", "MSc", 
+    "B.A.", "M.A.", "BTech", "MTech", "MBA", "Engineering", "Architecture", "Computer Science", 
+    "Information Technology", "Data Science", "Machine Learning", "AI", "Software Engineering",
+    "CSSA", "Certified", "Business", "MIS", "University"
+]
+QUALIFICATION_MATCHER = shared_resource("qualification_matcher", lambda: KeywordMatcher(QUALIFICATION_KEYWORDS))
+
+def extract_qualifications(text, sections=None):
+    sections = segment_sections(text) if sections is None else sections
+    edu_text = section_text(text, sections, "Education", stop_at_blank_line=True)
+    if edu_text:
         education_entries = [line.strip() for line in edu_text.split("\n") if line.strip() 
                             and any(keyword in line for keyword in ["Bachelor", "Master", "PhD", "Degree"])]
         if education_entries:
             return education_entries
-    found_qualifications = [qual for qual in qualification_keywords if re.search(rf"\b{qual}\b", text, re.IGNORECASE)]
-    return list(set(found_qualifications)) if found_qualifications else ["Not Found"]
+    found_qualifications = QUALIFICATION_MATCHER.find_all(text)
+    return found_qualifications if found_qualifications else ["Not Found"]
 
-def extract_employment_history(text):
-    employment_section = re.search(r"Employment History\n(.*?)(?:\nEducation|\n\nEducation|$)", text, re.DOTALL | re.IGNORECASE)
-    if not employment_section:
+def extract_employment_history(text, sections=None):
+    sections = segment_sections(text) if sections is None else sections
+    employment_text = section_text(text, sections, "Employment History")
+    if employment_text is None:
         return ["Employment history not found"]
-    employment_text = employment_section.group(1)
-    job_pattern = re.findall(r"(.*?),\s+(.*?),\s+(.*?)\n(\w+\s+\d{4})\s*[—–-]\s*(\w+\s+\d{4}|PRESENT)", 
-                             employment_text, re.IGNORECASE | re.MULTILINE)
+    job_pattern = EMPLOYMENT_WITH_LOCATION_PATTERN.findall(employment_text)
     if not job_pattern:
-        job_pattern = re.findall(r"(.*?),\s+(.*?)\n(\w+\s+\d{4})\s*[—–-]\s*(\w+\s+\d{4}|PRESENT)", 
-                                employment_text, re.IGNORECASE | re.MULTILINE)
+        job_pattern = EMPLOYMENT_PATTERN.findall(employment_text)
     if not job_pattern:
         lines = employment_text.split("\n")
         jobs = []
         for i, line in enumerate(lines):
-            if re.search(r"\b(architect|analyst|lead|principal|manager|director|engineer)\b", line, re.IGNORECASE):
+            if SENIOR_TITLE_PATTERN.search(line):
                 if i < len(lines) - 1 and re.search(r"\d{4}", lines[i+1]):
                     jobs.append(line)
         return jobs if jobs else ["Could not parse employment details"]
@@ -362,16 +875,18 @@ def extract_employment_history(text):
             formatted_jobs.append(f"{job[0]} at {job[1]} ({job[2]} - {job[3]})")
     return formatted_jobs
 
-def extract_profile_summary(text):
-    profile_section = re.search(r"Profile\n(.*?)(?:\nEmployment|\n\nEmployment)", text, re.DOTALL)
-    if profile_section:
-        profile_text = profile_section.group(1).strip()
+def extract_profile_summary(text, sections=None):
+    sections = segment_sections(text) if sections is None else sections
+    profile_text = section_text(text, sections, "Profile")
+    if profile_text is not None:
+        profile_text = profile_text.strip()
         if len(profile_text) > 500:
             return profile_text[:497] + "..."
         return profile_text
-    alt_section = re.search(r"(Summary|About)\n(.*?)(?:\n\n|\nSkills|\nExperience)", text, re.DOTALL)
-    if alt_section:
-        return alt_section.group(2).strip()
+    for name in ["Summary", "About"]:
+        alt_text = section_text(text, sections, name, stop_at_blank_line=True)
+        if alt_text is not None:
+            return alt_text.strip()
     return "Profile summary not found"
 
 # Display parsed resume in a nice format
@@ -444,7 +959,7 @@ def display_parsed_resume(parsed_data):
 
 # ---------------- Job Scraping and Matching Functions ----------------
 
-def get_chrome_binary():
+def find_chrome_binary():
     possible_paths = [
         "/opt/google/chrome/chrome",
         "/usr/bin/chromium",
@@ -455,38 +970,54 @@ def get_chrome_binary():
             return path
     return None
 
+def get_chrome_binary():
+    # Raises instead of caching a missing binary, so a browser installed later is still found
+    def find():
+        chrome_binary = find_chrome_binary()
+        if not chrome_binary:
+            raise Exception("No Chrome or Chromium binary found!")
+        return chrome_binary
+    return shared_resource("chrome_binary", find)
+
+def install_chromedriver(driver_version):
+    # Downloads (or finds in webdriver-manager's cache) the driver once per process
+    def install():
+        driver_path = ChromeDriverManager(driver_version=driver_version).install()
+        os.chmod(driver_path, 0o755)
+        return driver_path
+    return shared_resource(f"chromedriver-{driver_version}", install)
+
+def install_geckodriver():
+    return shared_resource("geckodriver", lambda: GeckoDriverManager().install())
+
 def init_chrome_driver():
     options = ChromeOptions()
     options.add_argument("--headless")
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--remote-debugging-port=9222")
+    options.add_argument("--remote-debugging-port=0")
     options.add_argument("--start-maximized")
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)")
     chrome_binary = get_chrome_binary()
-    if not chrome_binary:
-        raise Exception("No Chrome or Chromium binary found!")
     options.binary_location = chrome_binary
     if "google/chrome" in chrome_binary:
         driver_version = "133.0.6943.126"
     else:
         driver_version = "120.0.6099.224"
-    driver_path = ChromeDriverManager(driver_version=driver_version).install()
-    os.chmod(driver_path, 0o755)
-    service = ChromeService(driver_path)
+    service = ChromeService(install_chromedriver(driver_version))
     driver = webdriver.Chrome(service=service, options=options)
     return driver
 
 def init_firefox_driver():
     options = FirefoxOptions()
     options.add_argument("--headless")
-    driver_path = GeckoDriverManager().install()
-    service = FirefoxService(driver_path)
+    service = FirefoxService(install_geckodriver())
     driver = webdriver.Firefox(service=service, options=options)
     return driver
 
+@timed("init_driver")
 def init_driver():
     try:
         driver = init_chrome_driver()
@@ -498,16 +1029,298 @@ def init_driver():
         print("Initialized Firefox driver.")
         return driver
 
-def scrape_dice(job_role, driver, preferred_location="", preferred_salary=""):
-    print(f"🔍 Scraping Dice for: {job_role}")
+# ---------------- Driver Pool ----------------
+
+DRIVER_POOL_SIZE = int(os.environ.get("DRIVER_POOL_SIZE", "3"))
+DRIVER_MAX_PAGE_LOADS = int(os.environ.get("DRIVER_MAX_PAGE_LOADS", "50"))
+DRIVER_IDLE_TIMEOUT = float(os.environ.get("DRIVER_IDLE_TIMEOUT", "300"))
+DRIVER_CHECKOUT_TIMEOUT = float(os.environ.get("DRIVER_CHECKOUT_TIMEOUT", "120"))
+
+class PooledDriver:
+    # Thin proxy around a WebDriver that counts page loads so the pool can recycle it
+    def __init__(self, driver):
+        self.driver = driver
+        self.page_loads = 0
+        self.last_used = time.monotonic()
+
+    def get(self, url):
+        self.page_loads += 1
+        return self.driver.get(url)
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+class DriverPool:
+    def __init__(self, size=DRIVER_POOL_SIZE, max_page_loads=DRIVER_MAX_PAGE_LOADS,
+                 idle_timeout=DRIVER_IDLE_TIMEOUT, factory=init_driver):
+        self.size = max(1, size)
+        self.max_page_loads = max_page_loads
+        self.idle_timeout = idle_timeout
+        self._factory = factory
+        self._idle = []
+        self._total = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._reaper = threading.Thread(target=self._reap_idle, name="driver-pool-reaper", daemon=True)
+        self._reaper.start()
+
+    def checkout(self, timeout=DRIVER_CHECKOUT_TIMEOUT):
+        deadline = time.monotonic() + timeout
+        while True:
+            pooled = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Driver pool is closed")
+                    if self._idle:
+                        # LIFO keeps the hottest browsers busy and lets the rest idle out
+                        pooled = self._idle.pop()
+                        break
+                    if self._total < self.size:
+                        self._total += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("Timed out waiting for a browser from the driver pool")
+                    self._cond.wait(remaining)
+            if pooled is None:
+                try:
+                    return PooledDriver(self._factory())
+                except Exception:
+                    self._release_slot()
+                    raise
+            if self._is_healthy(pooled):
+                return pooled
+            self._discard(pooled)
+
+    def checkin(self, pooled):
+        pooled.last_used = time.monotonic()
+        if self._closed or pooled.page_loads >= self.max_page_loads:
+            self._discard(pooled)
+            return
+        with self._cond:
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    @contextmanager
+    def driver(self, timeout=DRIVER_CHECKOUT_TIMEOUT):
+        pooled = self.checkout(timeout)
+        try:
+            yield pooled
+        finally:
+            self.checkin(pooled)
+
+    def close(self):
+        self._stop.set()
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+
+    def _is_healthy(self, pooled):
+        try:
+            pooled.driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, pooled):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            print("Failed to quit pooled driver:", e)
+        self._release_slot()
+
+    def _release_slot(self):
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
+
+    def _reap_idle(self):
+        interval = max(1.0, min(self.idle_timeout / 2, 30.0))
+        while not self._stop.wait(interval):
+            now = time.monotonic()
+            with self._cond:
+                expired = [p for p in self._idle if now - p.last_used > self.idle_timeout]
+                self._idle = [p for p in self._idle if p not in expired]
+            for pooled in expired:
+                self._discard(pooled)
+
+# One pool per server process, shared by every session and rerun
+@st.cache_resource
+def get_driver_pool():
+    pool = DriverPool()
+    atexit.register(pool.close)
+    return pool
+
+# ---------------- Concurrent Scraping ----------------
+
+SCRAPE_CONCURRENCY = int(os.environ.get("SCRAPE_CONCURRENCY", str(DRIVER_POOL_SIZE)))
+HOST_MAX_CONCURRENCY = int(os.environ.get("HOST_MAX_CONCURRENCY", "2"))
+HOST_MIN_INTERVAL = float(os.environ.get("HOST_MIN_INTERVAL", "1.0"))
+
+class HostThrottle:
+    # Politeness limits: at most max_concurrency requests in flight per host,
+    # and request starts spaced at least min_interval seconds apart
+    def __init__(self, max_concurrency=HOST_MAX_CONCURRENCY, min_interval=HOST_MIN_INTERVAL):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_start = {}
+
+    @contextmanager
+    def slot(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.BoundedSemaphore(self.max_concurrency))
+        with semaphore:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + self.min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+@st.cache_resource
+def get_host_throttle():
+    return HostThrottle()
+
+# ---------------- Page Readiness ----------------
+
+# One of "selector", "network_idle", "selector+network_idle" or "fixed" (the old 5 second sleep)
+PAGE_READY_STRATEGY = os.environ.get("PAGE_READY_STRATEGY", "selector+network_idle")
+PAGE_READY_TIMEOUT = float(os.environ.get("PAGE_READY_TIMEOUT", "15"))
+NETWORK_IDLE_WINDOW = float(os.environ.get("NETWORK_IDLE_WINDOW", "0.5"))
+JOB_CARD_SELECTOR = "div.card"
+# Dice's "no jobs found" message; seeing it ends the wait instead of running out the timeout
+DICE_NO_RESULTS_SELECTOR = os.environ.get("DICE_NO_RESULTS_SELECTOR", "[data-testid='no-results'], .no-results")
+
+class PageReadyMetrics:
+    def __init__(self, maxlen=1000):
+        self._samples = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record(self, strategy, seconds, ready, empty=False):
+        with self._lock:
+            self._samples.append({"strategy": strategy, "seconds": seconds, "ready": ready, "empty": empty})
+
+    def summary(self):
+        with self._lock:
+            samples = list(self._samples)
+        if not samples:
+            return {"pages": 0}
+        times = sorted(sample["seconds"] for sample in samples)
+        return {
+            "pages": len(times),
+            "timeouts": sum(1 for sample in samples if not sample["ready"]),
+            "empty": sum(1 for sample in samples if sample["empty"]),
+            "p50": times[len(times) // 2],
+            "p90": times[min(len(times) - 1, int(len(times) * 0.9))],
+            "max": times[-1]
+        }
+
+@st.cache_resource
+def get_page_ready_metrics():
+    return PageReadyMetrics()
+
+def wait_for_results(driver, timeout):
+    # Job cards or the no-results message, whichever shows up first.
+    # Returns "cards", "empty" or None on timeout.
+    if not wait_for_selector(driver, f"{JOB_CARD_SELECTOR}, {DICE_NO_RESULTS_SELECTOR}", timeout):
+        return None
+    return "cards" if driver.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR) else "empty"
+
+def wait_for_selector(driver, selector, timeout):
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
+        return True
+    except TimeoutException:
+        return False
+
+def wait_for_network_idle(driver, timeout, idle_window=NETWORK_IDLE_WINDOW):
+    # Heuristic: the document has finished loading and no new resource
+    # requests have shown up in the performance timeline for idle_window seconds
+    deadline = time.monotonic() + timeout
+    last_count = -1
+    stable_since = time.monotonic()
+    while time.monotonic() < deadline:
+        state, count = driver.execute_script(
+            "return [document.readyState, performance.getEntriesByType('resource').length];"
+        )
+        now = time.monotonic()
+        if state != "complete" or count != last_count:
+            last_count = count
+            stable_since = now
+        elif now - stable_since >= idle_window:
+            return True
+        time.sleep(0.1)
+    return False
+
+@timed("page_ready")
+def wait_for_page_ready(driver, strategy=PAGE_READY_STRATEGY, timeout=PAGE_READY_TIMEOUT):
+    start = time.monotonic()
+    empty = False
+    if strategy == "fixed":
+        time.sleep(5)
+        ready = True
+    elif strategy == "selector":
+        result = wait_for_results(driver, timeout)
+        ready, empty = result is not None, result == "empty"
+    elif strategy == "network_idle":
+        ready = wait_for_network_idle(driver, timeout)
+    elif strategy == "selector+network_idle":
+        result = wait_for_results(driver, timeout)
+        ready, empty = result is not None, result == "empty"
+        if result == "cards":
+            # Cards keep streaming in after the first one appears, so let the page settle
+            wait_for_network_idle(driver, max(0.0, timeout - (time.monotonic() - start)))
+    else:
+        raise ValueError(f"Unknown page ready strategy: {strategy}")
+    elapsed = time.monotonic() - start
+    get_page_ready_metrics().record(strategy, elapsed, ready, empty)
+    outcome = ", no results" if empty else ("" if ready else ", timed out")
+    print(f"⏱️ Page ready in {elapsed:.2f}s ({strategy}{outcome})")
+    return ready
+
+# ---------------- Dice Scraping ----------------
+
+DICE_BASE_URL = os.environ.get("DICE_BASE_URL", "https://www.dice.com")
+HTTP_FAST_PATH = os.environ.get("HTTP_FAST_PATH", "1") == "1"
+HTTP_TIMEOUT = float(os.environ.get("HTTP_TIMEOUT", "10"))
+HTTP_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+DICE_PAGE_SIZE = 20
+# One of "lxml", "strainer" or "html.parser" (the original full-tree parser)
+DICE_PARSER = os.environ.get("DICE_PARSER", "lxml" if lxml is not None else "strainer")
+
+# Matches "card" inside a raw class attribute, which is what SoupStrainer sees while parsing
+CARD_CLASS_PATTERN = re.compile(r"(?:^|\s)card(?:\s|$)")
+
+# data-cy attribute -> field for the single-pass card extractors
+CARD_DATA_CY_FIELDS = {
+    ("span", "search-result-location"): "location",
+    ("span", "search-result-employment-type"): "job_type",
+    ("span", "card-posted-date"): "posted",
+    ("span", "card-modified-date"): "updated",
+    ("div", "card-summary"): "description"
+}
+
+def build_dice_url(job_role, preferred_location="", preferred_salary="", base_url=None, page=1):
     formatted_role = job_role.replace(" ", "%20")
     # Use location and salary from user preferences if provided
     loc_param = preferred_location if preferred_location and preferred_location != "Select Location" else ""
     salary_param = preferred_salary if preferred_salary and preferred_salary != "Select Salary Range" else ""
-    url = f"https://www.dice.com/jobs?q={formatted_role}&location={loc_param}&salary={salary_param}&countryCode=US&page=1&pageSize=20&language=en"
-    driver.get(url)
-    time.sleep(5)
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    base_url = (base_url or DICE_BASE_URL).rstrip("/")
+    return f"{base_url}/jobs?q={formatted_role}&location={loc_param}&salary={salary_param}&countryCode=US&page={page}&pageSize={DICE_PAGE_SIZE}&language=en"
+
+def parse_dice_cards_full(html, job_role):
+    soup = BeautifulSoup(html, "html.parser")
     job_elements = soup.find_all("div", class_="card")
     jobs = []
     for job in job_elements:
@@ -533,78 +1346,1184 @@ def scrape_dice(job_role, driver, preferred_location="", preferred_salary=""):
             })
     return jobs
 
-def extract_career_goal_keywords(career_goals):
-    if not career_goals:
-        return {}
-    goals_data = {
-        "job_titles": [],
-        "locations": [],
-        "work_preferences": [],
-        "industries": []
+def card_fields_to_job(job_role, fields):
+    return {
+        "Job Role": job_role,
+        "Title": fields["title"],
+        "Apply Link": fields["link"],
+        "Location": fields.get("location", "N/A"),
+        "Job Type": fields.get("job_type", "N/A"),
+        "Posted Time": fields.get("posted", "N/A"),
+        "Updated Time": fields.get("updated", "N/A"),
+        "Description": fields.get("description", "N/A"),
+        "Company Name": fields.get("company", "N/A")
     }
-    job_title_patterns = [
-        r"(?:seeking|looking for|interested in)(?:\s+a)?\s+(?:role|position|job|career)?\s+(?:as|in)?\s+(?:an?)?\s+((?:senior|junior|lead|principal|staff)?\s*[a-z\s]+(?:engineer|developer|architect|manager|analyst|scientist|designer))",
-        r"(?:senior|junior|lead|principal|staff)?\s*([a-z\s]+(?:engineer|developer|architect|manager|analyst|scientist|designer))\s+(?:role|position|job)",
-        r"(?:become|be)\s+(?:a|an)\s+((?:senior|junior|lead|principal|staff)?\s*[a-z\s]+(?:engineer|developer|architect|manager|analyst|scientist|designer))"
-    ]
-    for pattern in job_title_patterns:
-        matches = re.findall(pattern, career_goals.lower())
-        if matches:
-            goals_data["job_titles"].extend([title.strip().title() for title in matches])
-    common_titles = [
-        "software engineer", "data scientist", "machine learning engineer", 
-        "devops engineer", "full stack developer", "frontend developer", 
+
+def parse_dice_cards_strainer(html, job_role):
+    # Only build the tree for card containers, then walk each card once
+    soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("div", class_=CARD_CLASS_PATTERN))
+    jobs = []
+    for card in soup.find_all("div", class_="card"):
+        fields = {}
+        for element in card.find_all(True):
+            name = element.name
+            if name == "h5":
+                if "title" not in fields:
+                    fields["title"] = element.text.strip()
+            elif name == "a":
+                if "link" not in fields and element.has_attr("href"):
+                    fields["link"] = element["href"]
+                label = element.get("aria-label")
+                if "company" not in fields and label and "company page for" in label:
+                    fields["company"] = element.text.strip()
+            else:
+                field = CARD_DATA_CY_FIELDS.get((name, element.get("data-cy")))
+                if field and field not in fields:
+                    fields[field] = element.text.strip()
+        if "title" in fields and "link" in fields:
+            jobs.append(card_fields_to_job(job_role, fields))
+    return jobs
+
+def parse_dice_cards_lxml(html, job_role):
+    if not html or not html.strip():
+        return []
+    tree = lxml.html.fromstring(html)
+    jobs = []
+    for card in tree.xpath('//div[contains(concat(" ", normalize-space(@class), " "), " card ")]'):
+        fields = {}
+        for element in card.iterdescendants():
+            name = element.tag
+            if name == "h5":
+                if "title" not in fields:
+                    fields["title"] = element.text_content().strip()
+            elif name == "a":
+                href = element.get("href")
+                if "link" not in fields and href is not None:
+                    fields["link"] = href
+                label = element.get("aria-label")
+                if "company" not in fields and label and "company page for" in label:
+                    fields["company"] = element.text_content().strip()
+            elif isinstance(name, str):
+                field = CARD_DATA_CY_FIELDS.get((name, element.get("data-cy")))
+                if field and field not in fields:
+                    fields[field] = element.text_content().strip()
+        if "title" in fields and "link" in fields:
+            jobs.append(card_fields_to_job(job_role, fields))
+    return jobs
+
+DICE_PARSERS = {
+    "html.parser": parse_dice_cards_full,
+    "strainer": parse_dice_cards_strainer,
+    "lxml": parse_dice_cards_lxml
+}
+
+@timed("parse_html")
+def parse_dice_cards(html, job_role, backend=None):
+    backend = backend or DICE_PARSER
+    if backend == "lxml" and lxml is None:
+        backend = "strainer"
+    if backend not in DICE_PARSERS:
+        raise ValueError(f"Unknown Dice parser backend: {backend}")
+    return DICE_PARSERS[backend](html, job_role)
+
+# Keep-alive session shared by every scrape in the process; urllib3 pools the connections
+@st.cache_resource
+def get_http_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=max(4, SCRAPE_CONCURRENCY * 2),
+        max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": HTTP_USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive"
+    })
+    return session
+
+@timed("http_fetch")
+def fetch_dice_html(url, session=None, timeout=HTTP_TIMEOUT):
+    session = session or get_http_session()
+    with get_host_throttle().slot(url):
+        response = session.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+def scrape_dice_http(job_role, preferred_location="", preferred_salary="", base_url=None, session=None, page=1):
+    url = build_dice_url(job_role, preferred_location, preferred_salary, base_url, page)
+    try:
+        html = fetch_dice_html(url, session)
+    except requests.RequestException as e:
+        print(f"HTTP fetch failed for {job_role}:", e)
+        return []
+    return parse_dice_cards(html, job_role)
+
+def scrape_dice_browser(job_role, driver=None, preferred_location="", preferred_salary="", base_url=None, page=1):
+    if driver is None:
+        with get_driver_pool().driver() as pooled:
+            return scrape_dice_browser(job_role, pooled, preferred_location, preferred_salary, base_url, page)
+    url = build_dice_url(job_role, preferred_location, preferred_salary, base_url, page)
+    with get_host_throttle().slot(url), timed("page_load"):
+        driver.get(url)
+    wait_for_page_ready(driver)
+    return parse_dice_cards(driver.page_source, job_role)
+
+def fetch_dice_jobs(job_role, driver=None, preferred_location="", preferred_salary="", page=1):
+    print(f"🔍 Scraping Dice for: {job_role}")
+    # Try a plain HTTP fetch first; only render the page in a browser when it yields no cards
+    if HTTP_FAST_PATH:
+        jobs = scrape_dice_http(job_role, preferred_location, preferred_salary, page=page)
+        if jobs:
+            return jobs
+        print(f"No cards from HTTP fast path for {job_role}, falling back to browser.")
+    return scrape_dice_browser(job_role, driver, preferred_location, preferred_salary, page=page)
+
+# ---------------- Scrape Cache ----------------
+
+SCRAPE_CACHE_TTL = float(os.environ.get("SCRAPE_CACHE_TTL", "900"))
+SCRAPE_CACHE_STALE_TTL = float(os.environ.get("SCRAPE_CACHE_STALE_TTL", "3600"))
+SCRAPE_CACHE_MAX_ENTRIES = int(os.environ.get("SCRAPE_CACHE_MAX_ENTRIES", "500"))
+
+def scrape_cache_key(job_role, preferred_location="", preferred_salary="", page=1):
+    role = " ".join(job_role.lower().split())
+    location = preferred_location if preferred_location and preferred_location != "Select Location" else ""
+    salary = preferred_salary if preferred_salary and preferred_salary != "Select Salary Range" else ""
+    return json.dumps([role, location.strip().lower(), salary.strip().lower(), int(page)])
+
+class ScrapeCache:
+    # SQLite-backed TTL cache with stale-while-revalidate and LRU eviction.
+    # Entries younger than ttl are fresh; up to ttl + stale_ttl they are served
+    # while a background refresh runs; older entries count as misses.
+    def __init__(self, path, ttl=SCRAPE_CACHE_TTL, stale_ttl=SCRAPE_CACHE_STALE_TTL, max_entries=SCRAPE_CACHE_MAX_ENTRIES):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS scrape_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS scrape_cache_accessed ON scrape_cache (accessed_at)")
+
+    def get(self, key):
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value, fetched_at FROM scrape_cache WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] > self.ttl + self.stale_ttl:
+                self.misses += 1
+                return None, "miss"
+            self._conn.execute("UPDATE scrape_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            if now - row[1] > self.ttl:
+                self.stale_hits += 1
+                state = "stale"
+            else:
+                self.hits += 1
+                state = "fresh"
+        # Decode on every read so callers can mutate the returned jobs freely
+        return json.loads(row[0]), state
+
+    def set(self, key, value, fetched_at=None):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scrape_cache (key, value, fetched_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now if fetched_at is None else fetched_at, now)
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM scrape_cache").fetchone()[0]
+            if count > self.max_entries:
+                excess = count - self.max_entries
+                self._conn.execute(
+                    "DELETE FROM scrape_cache WHERE key IN (SELECT key FROM scrape_cache ORDER BY accessed_at ASC LIMIT ?)",
+                    (excess,)
+                )
+                self.evictions += excess
+
+    def get_or_fetch(self, key, fetch, refresh=None, stored=None):
+        # On a miss, stored() may offer (value, fetched_at) from a slower store. It is cached
+        # under its original fetch time, so the TTLs still bound how old served data is.
+        value, state = self.get(key)
+        if state == "miss" and stored is not None:
+            stored_value, fetched_at = stored()
+            age = time.time() - fetched_at if stored_value else None
+            if age is not None and age <= self.ttl + self.stale_ttl:
+                self.set(key, stored_value, fetched_at)
+                value, state = stored_value, "stale" if age > self.ttl else "fresh"
+        if state == "stale":
+            self._refresh_in_background(key, refresh or fetch)
+        if state != "miss":
+            return value
+        value = fetch()
+        # Empty results are usually a blocked or failed fetch, so don't pin them
+        if value:
+            self.set(key, value)
+        return value
+
+    def stats(self):
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM scrape_cache").fetchone()[0]
+            return {
+                "entries": entries,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+
+    def _refresh_in_background(self, key, fetch):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                value = fetch()
+                if value:
+                    self.set(key, value)
+            except Exception as e:
+                print("Background cache refresh failed:", e)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name="scrape-cache-refresh", daemon=True).start()
+
+@st.cache_resource
+def get_scrape_cache():
+    return ScrapeCache(os.path.join(CACHE_DIR, "scrape_cache.sqlite3"))
+
+# ---------------- Job Store ----------------
+
+JOB_STORE_COLUMNS = [
+    ("title", "Title"),
+    ("company", "Company Name"),
+    ("location", "Location"),
+    ("job_type", "Job Type"),
+    ("posted_time", "Posted Time"),
+    ("updated_time", "Updated Time"),
+    ("description", "Description"),
+    ("apply_link", "Apply Link")
+]
+
+def job_key(job):
+    # Stable id for a posting: its apply link without the per-search query string
+    parsed = urlparse(job.get("Apply Link", "").strip())
+    normalized = f"{parsed.netloc.lower()}{parsed.path.rstrip('/')}" if parsed.netloc else parsed.path.rstrip("/")
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+class JobStore:
+    # SQLite store of scraped postings, deduplicated by job_key. Postings found
+    # under several roles are stored once and linked to each role; every search
+    # remembers which postings it returned, in order, and when it ran.
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_key TEXT PRIMARY KEY,
+                    title TEXT, company TEXT, location TEXT, job_type TEXT,
+                    posted_time TEXT, updated_time TEXT, description TEXT, apply_link TEXT,
+                    content_hash TEXT NOT NULL,
+                    first_seen REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS job_roles (
+                    job_key TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    PRIMARY KEY (job_key, role)
+                );
+                CREATE TABLE IF NOT EXISTS searches (
+                    search_key TEXT PRIMARY KEY,
+                    role TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS search_results (
+                    search_key TEXT NOT NULL,
+                    rank INTEGER NOT NULL,
+                    job_key TEXT NOT NULL,
+                    PRIMARY KEY (search_key, rank)
+                );
+            """)
+
+    def upsert_jobs(self, jobs, role=None):
+        # Rows are only rewritten when the posting's content actually changed
+        now = time.time()
+        keys = []
+        rows = []
+        for job in jobs:
+            key = job_key(job)
+            keys.append(key)
+            values = [job.get(field, "N/A") for _, field in JOB_STORE_COLUMNS]
+            content_hash = hashlib.sha1("\x1f".join(values).encode("utf-8")).hexdigest()
+            rows.append([key] + values + [content_hash, now, now])
+        columns = [column for column, _ in JOB_STORE_COLUMNS]
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns)
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(f"""
+                INSERT INTO jobs (job_key, {", ".join(columns)}, content_hash, first_seen, updated_at)
+                VALUES ({", ".join("?" * (len(columns) + 4))})
+                ON CONFLICT (job_key) DO UPDATE SET {updates},
+                    content_hash = excluded.content_hash, updated_at = excluded.updated_at
+                WHERE jobs.content_hash != excluded.content_hash
+            """, rows)
+            changed = self._conn.total_changes - before
+            if role:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO job_roles (job_key, role) VALUES (?, ?)", [(key, role) for key in keys]
+                )
+        return keys, changed
+
+    def save_search(self, search_key, role, jobs):
+        keys, _ = self.upsert_jobs(jobs, role)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM search_results WHERE search_key = ?", (search_key,))
+            self._conn.executemany(
+                "INSERT INTO search_results (search_key, rank, job_key) VALUES (?, ?, ?)",
+                [(search_key, rank, key) for rank, key in enumerate(keys)]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches (search_key, role, fetched_at) VALUES (?, ?, ?)",
+                (search_key, role, time.time())
+            )
+        return keys
+
+    def search_age(self, search_key):
+        with self._lock:
+            row = self._conn.execute("SELECT fetched_at FROM searches WHERE search_key = ?", (search_key,)).fetchone()
+        return None if row is None else time.time() - row["fetched_at"]
+
+    def recent_search(self, search_key, max_age):
+        # (jobs, fetched_at) of a previous identical search, or (None, None) if it is missing or too old
+        with self._lock:
+            search = self._conn.execute(
+                "SELECT role, fetched_at FROM searches WHERE search_key = ?", (search_key,)
+            ).fetchone()
+            if search is None or time.time() - search["fetched_at"] > max_age:
+                return None, None
+            rows = self._conn.execute("""
+                SELECT jobs.* FROM search_results
+                JOIN jobs ON jobs.job_key = search_results.job_key
+                WHERE search_results.search_key = ?
+                ORDER BY search_results.rank
+            """, (search_key,)).fetchall()
+        jobs = [self._row_to_job(row, search["role"]) for row in rows]
+        for job in jobs:
+            job.pop("job_key")
+        return jobs, search["fetched_at"]
+
+    def get_jobs(self, keys):
+        found = {}
+        keys = list(keys)
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT * FROM jobs WHERE job_key IN ({', '.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                for row in rows:
+                    found[row["job_key"]] = self._row_to_job(row)
+        return found
+
+    def _row_to_job(self, row, role=None):
+        job = {field: row[column] for column, field in JOB_STORE_COLUMNS}
+        job["job_key"] = row["job_key"]
+        if role:
+            job["Job Role"] = role
+        return job
+
+@st.cache_resource
+def get_job_store():
+    return JobStore(os.path.join(CACHE_DIR, "jobs.sqlite3"))
+
+def scrape_and_store(job_role, driver=None, preferred_location="", preferred_salary="", page=1):
+    jobs = fetch_dice_jobs(job_role, driver, preferred_location, preferred_salary, page)
+    if jobs:
+        get_job_store().save_search(scrape_cache_key(job_role, preferred_location, preferred_salary, page), job_role, jobs)
+    return jobs
+
+@timed("scrape_dice")
+def scrape_dice(job_role, driver=None, preferred_location="", preferred_salary="", page=1):
+    key = scrape_cache_key(job_role, preferred_location, preferred_salary, page)
+    cache = get_scrape_cache()
+    return cache.get_or_fetch(
+        key,
+        lambda: scrape_and_store(job_role, driver, preferred_location, preferred_salary, page),
+        # Background refreshes outlive this call, so they must not reuse the caller's driver
+        refresh=lambda: scrape_and_store(job_role, None, preferred_location, preferred_salary, page),
+        # An identical search stored by another process, or before the cache evicted it
+        stored=lambda: get_job_store().recent_search(key, cache.ttl + cache.stale_ttl)
+    )
+
+# ---------------- Async Scrape Engine ----------------
+
+ASYNC_SCRAPE_QUEUE_SIZE = int(os.environ.get("ASYNC_SCRAPE_QUEUE_SIZE", "16"))
+ASYNC_SCRAPE_RETRIES = int(os.environ.get("ASYNC_SCRAPE_RETRIES", "2"))
+ASYNC_SCRAPE_BACKOFF = float(os.environ.get("ASYNC_SCRAPE_BACKOFF", "0.5"))
+ASYNC_SCRAPE_BACKOFF_MAX = float(os.environ.get("ASYNC_SCRAPE_BACKOFF_MAX", "8"))
+
+ScrapeTask = namedtuple("ScrapeTask", ["role", "location", "salary", "page"])
+
+def fetch_scrape_task(task):
+    return scrape_dice(task.role, None, task.location, task.salary, task.page)
+
+def scrape_task_domain(task):
+    return urlparse(build_dice_url(task.role, task.location, task.salary, page=task.page)).netloc
+
+class AsyncScrapeEngine:
+    # Drives blocking scrape calls from an asyncio event loop. Tasks pass through a
+    # bounded queue, so a large task source is only pulled as fast as the workers
+    # drain it; a semaphore per domain caps the tasks in flight against each host,
+    # and failures are retried with jittered exponential backoff. on_result may
+    # return follow-up tasks (such as the next page), which jump ahead of the source.
+    def __init__(self, fetch=fetch_scrape_task, domain=scrape_task_domain, workers=SCRAPE_CONCURRENCY,
+                 queue_size=ASYNC_SCRAPE_QUEUE_SIZE, per_domain=HOST_MAX_CONCURRENCY, retries=ASYNC_SCRAPE_RETRIES,
+                 backoff=ASYNC_SCRAPE_BACKOFF, backoff_max=ASYNC_SCRAPE_BACKOFF_MAX):
+        self.fetch = fetch
+        self.domain = domain
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.per_domain = max(1, per_domain)
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+
+    async def run(self, tasks, on_result=None, on_progress=None):
+        # Returns (task, result, error) for every task in completion order; a task
+        # that still fails after its retries reports its last exception as error
+        pending = asyncio.Queue(maxsize=self.queue_size)
+        semaphores = defaultdict(lambda: asyncio.Semaphore(self.per_domain))
+        follow_ups = deque()
+        task_done = asyncio.Event()
+        completed = []
+        counts = {"submitted": 0, "outstanding": 0}
+
+        async def produce():
+            source = iter(tasks)
+            exhausted = False
+            while True:
+                if follow_ups:
+                    task = follow_ups.popleft()
+                elif not exhausted:
+                    task = next(source, None)
+                    exhausted = task is None
+                    if exhausted:
+                        continue
+                elif counts["outstanding"]:
+                    # Running tasks may still queue follow-ups
+                    task_done.clear()
+                    await task_done.wait()
+                    continue
+                else:
+                    break
+                counts["submitted"] += 1
+                counts["outstanding"] += 1
+                await pending.put(task)
+            for _ in range(self.workers):
+                await pending.put(None)
+
+        async def work():
+            while (task := await pending.get()) is not None:
+                try:
+                    result, error = await self._fetch_with_retries(task, semaphores)
+                    completed.append((task, result, error))
+                    if on_result is not None:
+                        follow_ups.extend(on_result(task, result, error) or ())
+                    if on_progress is not None:
+                        on_progress(len(completed), counts["submitted"])
+                finally:
+                    counts["outstanding"] -= 1
+                    task_done.set()
+
+        await asyncio.gather(produce(), *(work() for _ in range(self.workers)))
+        return completed
+
+    async def _fetch_with_retries(self, task, semaphores):
+        for attempt in range(self.retries + 1):
+            try:
+                async with semaphores[self.domain(task)]:
+                    return await asyncio.to_thread(self.fetch, task), None
+            except Exception as e:
+                if attempt == self.retries:
+                    return None, e
+                print(f"Scrape of {task} failed ({e}), retrying")
+                delay = min(self.backoff_max, self.backoff * 2 ** attempt)
+                await asyncio.sleep(random.uniform(delay / 2, delay))
+
+# One event loop per server process, running on its own thread so scrapes never
+# block a session's script thread
+@st.cache_resource
+def get_scrape_loop():
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="scrape-loop", daemon=True).start()
+    return loop
+
+# ---------------- Pagination ----------------
+
+DICE_MAX_PAGES = int(os.environ.get("DICE_MAX_PAGES", "5"))
+DICE_PAGE_CONCURRENCY = int(os.environ.get("DICE_PAGE_CONCURRENCY", "2"))
+HIGH_MATCH_SCORE = 60
+
+def stream_role_matches(roles, score_batch, max_jobs, min_score=HIGH_MATCH_SCORE, preferred_location="",
+                        preferred_salary="", max_workers=SCRAPE_CONCURRENCY * DICE_PAGE_CONCURRENCY,
+                        max_pages=DICE_MAX_PAGES, on_progress=None, fetch=fetch_scrape_task):
+    # Pages through every role on the async engine and yields (role, scored_jobs) as each
+    # page lands. Each role keeps DICE_PAGE_CONCURRENCY pages ahead and stops paging at its
+    # first empty page or once it has max_jobs jobs scoring at least min_score. A page
+    # that still fails after the engine's retries ends its role's paging like an empty
+    # page; the search only raises if no page at all came back.
+    # on_progress(pages_done, pages_expected) runs on the caller's thread. Closing the
+    # generator (e.g. the user navigating away mid-search) cancels the remaining scrapes.
+    if not roles:
+        return
+    events = queue.Queue()
+    # Pages can land out of order, so each role tracks the last page still worth having:
+    # an empty or failed page caps it below that page, and meeting the quota caps it at the current one
+    page_limit = {role: max_pages for role in roles}
+    next_page = {}
+    high_scoring = defaultdict(int)
+    pages_done = [0]
+    errors = []
+
+    def fetch_and_score(task):
+        if task.page > page_limit[task.role]:
+            return None
+        return score_batch(fetch(task))
+
+    engine = AsyncScrapeEngine(fetch=fetch_and_score, workers=max_workers)
+
+    def on_result(task, scored_jobs, error):
+        role = task.role
+        if task.page > page_limit[role]:
+            return ()
+        if error is not None:
+            errors.append(error)
+            page_limit[role] = task.page - 1
+        elif scored_jobs is None:
+            return ()
+        elif scored_jobs:
+            pages_done[0] += 1
+            events.put(("jobs", role, scored_jobs))
+            high_scoring[role] += sum(1 for job in scored_jobs if job["match_score"] >= min_score)
+            if high_scoring[role] >= max_jobs:
+                page_limit[role] = task.page
+        else:
+            page_limit[role] = task.page - 1
+        events.put(("progress", pages_done[0], sum(page_limit.values())))
+        if next_page[role] > page_limit[role]:
+            return ()
+        next_page[role] += 1
+        return [task._replace(page=next_page[role] - 1)]
+
+    initial = []
+    for page in range(1, min(max(1, DICE_PAGE_CONCURRENCY), max_pages) + 1):
+        for role in roles:
+            initial.append(ScrapeTask(role, preferred_location, preferred_salary, page))
+            next_page[role] = page + 1
+
+    async def search():
+        try:
+            await engine.run(initial, on_result)
+        finally:
+            events.put(None)
+
+    # Scrapes get a clean context carrying only the stage trace: inheriting the script
+    # thread's would hand worker threads Streamlit's container stack (e.g. inside st.status)
+    context = contextvars.Context()
+    context.run(CURRENT_STAGE_TRACE.set, CURRENT_STAGE_TRACE.get())
+    future = context.run(asyncio.run_coroutine_threadsafe, search(), get_scrape_loop())
+    try:
+        while (event := events.get()) is not None:
+            if event[0] == "progress":
+                if on_progress is not None:
+                    on_progress(event[1], event[2])
+            else:
+                yield event[1], event[2]
+        future.result()
+        if errors and not pages_done[0]:
+            raise errors[0]
+    finally:
+        future.cancel()
+
+# ---------------- Pre-scraping ----------------
+
+DEFAULT_JOB_ROLES = ["Software Engineer", "Data Scientist", "Full Stack Developer"]
+EXTRA_JOB_ROLES = ["DevOps Engineer", "Data Engineer", "Frontend Developer", "Backend Developer"]
+# Background traffic to Dice from every server process, so it is opt-in
+PRESCRAPE_ENABLED = os.environ.get("PRESCRAPE_ENABLED", "0") == "1"
+PRESCRAPE_ROLES = [role.strip() for role in os.environ.get(
+    "PRESCRAPE_ROLES", ",".join(DEFAULT_JOB_ROLES + EXTRA_JOB_ROLES)
+).split(",") if role.strip()]
+# An empty entry is the no-location search users get with "Select Location", the only
+# one the app itself runs; list more (comma-separated) to warm searches made elsewhere
+PRESCRAPE_LOCATIONS = [location.strip() for location in os.environ.get("PRESCRAPE_LOCATIONS", "").split(",")]
+PRESCRAPE_INTERVAL = float(os.environ.get("PRESCRAPE_INTERVAL", "1800"))
+PRESCRAPE_JITTER = float(os.environ.get("PRESCRAPE_JITTER", "0.2"))
+PRESCRAPE_CONCURRENCY = int(os.environ.get("PRESCRAPE_CONCURRENCY", "1"))
+PRESCRAPE_PAGES = int(os.environ.get("PRESCRAPE_PAGES", str(DICE_MAX_PAGES)))
+
+def search_freshness(job_role, preferred_location="", preferred_salary=""):
+    # Seconds since the first page of this search was last fetched, by anyone, or None
+    return get_job_store().search_age(scrape_cache_key(job_role, preferred_location, preferred_salary))
+
+class PrescrapeScheduler:
+    # Keeps popular (role, location) searches warm in the job store and scrape cache.
+    # Each cycle visits the targets in random order with at most `concurrency` scrapes
+    # in flight, skips searches something else refreshed recently, then sleeps for the
+    # interval +/- jitter so several server processes don't hit Dice in lockstep.
+    def __init__(self, roles=PRESCRAPE_ROLES, locations=PRESCRAPE_LOCATIONS, interval=PRESCRAPE_INTERVAL,
+                 jitter=PRESCRAPE_JITTER, concurrency=PRESCRAPE_CONCURRENCY, pages=PRESCRAPE_PAGES):
+        self.targets = [(role, location) for role in roles for location in locations]
+        self.interval = interval
+        self.jitter = jitter
+        self.concurrency = max(1, concurrency)
+        self.pages = max(1, pages)
+        self._lock = threading.Lock()
+        self._status = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="prescrape", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def status(self):
+        with self._lock:
+            return {target: dict(entry) for target, entry in self._status.items()}
+
+    def run_cycle(self):
+        targets = list(self.targets)
+        random.shuffle(targets)
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="prescrape") as executor:
+            for target in targets:
+                executor.submit(self._refresh, *target)
+
+    def _refresh(self, role, location):
+        if self._stop.is_set():
+            return
+        age = search_freshness(role, location)
+        if age is not None and age < self.interval / 2:
+            return
+        started = time.time()
+        entry = {"started_at": started, "pages": 0, "jobs": 0, "error": None}
+        try:
+            for page in range(1, self.pages + 1):
+                jobs = scrape_and_store(role, None, location, "", page)
+                if not jobs:
+                    break
+                get_scrape_cache().set(scrape_cache_key(role, location, "", page), jobs)
+                entry["pages"] += 1
+                entry["jobs"] += len(jobs)
+        except Exception as e:
+            entry["error"] = f"{type(e).__name__}: {e}"
+            print(f"Pre-scrape of {role!r} in {location or 'any location'!r} failed:", e)
+        entry["finished_at"] = time.time()
+        with self._lock:
+            self._status[(role, location)] = entry
+
+    def _run(self):
+        # A short random start delay spreads out processes that boot together
+        delay = random.uniform(0, max(1.0, self.interval * self.jitter))
+        while not self._stop.wait(delay):
+            try:
+                self.run_cycle()
+            except Exception as e:
+                print("Pre-scrape cycle failed:", e)
+            delay = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+@st.cache_resource
+def get_prescrape_scheduler():
+    scheduler = PrescrapeScheduler().start()
+    atexit.register(scheduler.stop)
+    return scheduler
+
+# ---------------- Semantic Matching ----------------
+
+# Hashed TF-IDF: tokens and bigrams are hashed into SEMANTIC_DIM buckets, so vectors
+# need no fitted vocabulary and a job's vector never changes once computed
+SEMANTIC_DIM = int(os.environ.get("SEMANTIC_DIM", "4096"))
+JOB_VECTOR_CACHE_SIZE = int(os.environ.get("JOB_VECTOR_CACHE_SIZE", "20000"))
+SEMANTIC_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./]*[a-z0-9+#]|[a-z0-9]")
+SEMANTIC_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have i in is it its of on or our the to we with you your "
+    "will this that who what work working team teams experience years year strong ability".split()
+)
+# Canonical term -> spellings that should count as the same thing
+SEMANTIC_SYNONYMS = {
+    "javascript": ["js", "ecmascript"],
+    "typescript": ["ts"],
+    "kubernetes": ["k8s"],
+    "golang": ["go lang"],
+    "postgresql": ["postgres", "psql"],
+    "aws": ["amazon web services"],
+    "gcp": ["google cloud platform", "google cloud"],
+    "azure": ["microsoft azure"],
+    "machine learning": ["ml"],
+    "artificial intelligence": ["ai"],
+    "natural language processing": ["nlp"],
+    "deep learning": ["neural networks"],
+    "react": ["reactjs", "react.js"],
+    "node.js": ["nodejs"],
+    "c#": ["csharp", "c sharp"],
+    "ci/cd": ["cicd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "frontend": ["front end", "front-end"],
+    "backend": ["back end", "back-end"],
+    "full stack": ["fullstack", "full-stack"],
+    "site reliability": ["sre"],
+    "developer": ["engineer", "programmer"]
+}
+SEMANTIC_SYNONYM_LOOKUP = {variant: canonical for canonical, variants in SEMANTIC_SYNONYMS.items() for variant in variants}
+SEMANTIC_SYNONYM_PATTERN = re.compile(
+    r"(?<![\w+#./])(?:" + "|".join(re.escape(variant) for variant in sorted(SEMANTIC_SYNONYM_LOOKUP, key=len, reverse=True)) + r")(?![\w+#])"
+)
+
+def semantic_terms(text):
+    text = SEMANTIC_SYNONYM_PATTERN.sub(lambda match: SEMANTIC_SYNONYM_LOOKUP[match.group(0)], text.lower())
+    tokens = [token for token in SEMANTIC_TOKEN_PATTERN.findall(text) if token not in SEMANTIC_STOPWORDS]
+    return tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+
+def hashed_term_vector(text, dim=SEMANTIC_DIM):
+    # Sparse (bucket indices, sublinear term frequencies); crc32 is stable across processes
+    terms = semantic_terms(text)
+    if not terms:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+    buckets = np.fromiter((zlib.crc32(term.encode("utf-8")) % dim for term in terms), dtype=np.int32, count=len(terms))
+    indices, counts = np.unique(buckets, return_counts=True)
+    return indices, (1.0 + np.log(counts)).astype(np.float32)
+
+def job_vector_text(job):
+    # The title counts twice: it says more about the role than any one line of the description
+    return f"{job.get('Title', '')} {job.get('Title', '')} {job.get('Description', '')}"
+
+def resume_vector_text(resume_data, motivation_data=None):
+    parts = [resume_data.get("profile_summary", "")]
+    for field in ("skills", "qualifications", "employment_history"):
+        parts.extend(resume_data.get(field, []))
+    if motivation_data:
+        parts.append(motivation_data.get("career_goals", ""))
+    return " ".join(part for part in parts if isinstance(part, str))
+
+class JobVectorCache:
+    # Process-wide LRU of job vectors, keyed by posting and content, so each job is
+    # vectorized once no matter how many searches or sessions see it
+    def __init__(self, max_entries=JOB_VECTOR_CACHE_SIZE, dim=SEMANTIC_DIM):
+        self.max_entries = max_entries
+        self.dim = dim
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def vector(self, job):
+        text = job_vector_text(job)
+        key = (job_key(job), hashlib.sha1(text.encode("utf-8")).hexdigest())
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                return vector
+        vector = hashed_term_vector(text, self.dim)
+        with self._lock:
+            self._entries[key] = vector
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return vector
+
+@st.cache_resource
+def get_job_vector_cache():
+    return JobVectorCache()
+
+class SemanticIndex:
+    # Jobs as rows of a dense TF-IDF matrix (L2-normalized), so matching a resume against
+    # every job is one matrix-vector product. IDF comes from the indexed jobs; the matrix
+    # is rebuilt lazily after new jobs arrive, reusing each job's cached term vector.
+    def __init__(self, dim=SEMANTIC_DIM, cache=None):
+        self.dim = dim
+        self._cache = cache
+        self._lock = threading.Lock()
+        self.keys = []
+        self._positions = {}
+        self._vectors = []
+        self._document_frequency = np.zeros(dim, dtype=np.float32)
+        self._matrix = None
+        self._idf = None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, jobs):
+        cache = self._cache or get_job_vector_cache()
+        added = [(job_key(job), job) for job in jobs]
+        vectors = [cache.vector(job) for _, job in added]
+        with self._lock:
+            for (key, _), vector in zip(added, vectors):
+                if key in self._positions:
+                    continue
+                self._positions[key] = len(self.keys)
+                self.keys.append(key)
+                self._vectors.append(vector)
+                self._document_frequency[vector[0]] += 1
+                self._matrix = None
+        return [self._positions[key] for key, _ in added]
+
+    def similarities(self, text):
+        # Cosine similarity of every indexed job to the text, in index order
+        with self._lock:
+            matrix, idf = self._weighted_matrix()
+        if matrix.shape[0] == 0:
+            return np.zeros(0, dtype=np.float32)
+        return matrix @ self._query_vector(text, idf)
+
+    def top_k(self, text, k=10):
+        scores = self.similarities(text)
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        # argpartition finds the k best in linear time; only those k get sorted
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(self.keys[i], float(scores[i])) for i in best]
+
+    def score_jobs(self, jobs, text):
+        # Adds the jobs and returns their similarities to the text, in order. Works on the
+        # sparse vectors directly, so streaming pages in doesn't rebuild the dense matrix.
+        # The IDF is that of the jobs indexed so far, so scores from earlier calls aren't
+        # comparable with later ones; similarities() scores everything on one IDF.
+        positions = self.add(jobs)
+        with self._lock:
+            idf = self._current_idf()
+            vectors = [self._vectors[position] for position in positions]
+        if not vectors:
+            return []
+        query = self._query_vector(text, idf)
+        row_ids, columns, weights = self._weighted_entries(vectors, idf)
+        dots = np.bincount(row_ids, weights=weights * query[columns], minlength=len(vectors))
+        norms = np.sqrt(np.bincount(row_ids, weights=weights * weights, minlength=len(vectors)))
+        return [float(dot / norm) if norm > 0 else 0.0 for dot, norm in zip(dots, norms)]
+
+    def _query_vector(self, text, idf):
+        indices, tf = hashed_term_vector(text, self.dim)
+        query = np.zeros(self.dim, dtype=np.float32)
+        query[indices] = tf * idf[indices]
+        norm = np.linalg.norm(query)
+        return query / norm if norm > 0 else query
+
+    def _current_idf(self):
+        if self._idf is None or self._matrix is None:
+            rows = len(self._vectors)
+            self._idf = (np.log((1.0 + rows) / (1.0 + self._document_frequency)) + 1.0).astype(np.float32)
+        return self._idf
+
+    def _weighted_entries(self, vectors, idf):
+        lengths = [len(indices) for indices, _ in vectors]
+        row_ids = np.repeat(np.arange(len(vectors)), lengths)
+        columns = np.concatenate([indices for indices, _ in vectors])
+        weights = np.concatenate([tf for _, tf in vectors]) * idf[columns]
+        return row_ids, columns, weights
+
+    def _weighted_matrix(self):
+        if self._matrix is None:
+            idf = self._current_idf()
+            rows = len(self._vectors)
+            matrix = np.zeros((rows, self.dim), dtype=np.float32)
+            if rows:
+                row_ids, columns, weights = self._weighted_entries(self._vectors, idf)
+                # Normalize the sparse entries before scattering them; far cheaper than a dense norm
+                norms = np.sqrt(np.bincount(row_ids, weights=weights * weights, minlength=rows))
+                matrix[row_ids, columns] = weights / np.where(norms > 0, norms, 1.0)[row_ids]
+            self._matrix = matrix
+        return self._matrix, self._idf
+
+# ---------------- Candidate Index ----------------
+
+# Reverse matching: rank parsed resumes against one posting. Free-text skill lines
+# longer than this don't go into the skill vocabulary
+CANDIDATE_SKILL_MAX_LENGTH = 40
+CANDIDATE_EXPERIENCE_PATTERN = re.compile(r"(\d+) years of experience")
+
+def location_city(location):
+    # "Seattle, WA" and "Seattle, United States" both become "seattle"
+    city = location.split(",")[0].strip().lower()
+    return "" if city in ("", "location not found", "n/a") else city
+
+class CandidateIndex:
+    # Columnar index over parsed resumes. Each skill has a sorted posting list of
+    # candidate rows, locations are integer codes and experience a float column, so
+    # scoring a posting is a few numpy scatter-adds over the candidates it touches.
+    # Per-candidate skills are kept CSR-style (offsets into one array of skill ids).
+    # Scoring mirrors calculate_job_match_score from the other side: 5 points per
+    # shared skill, 5 for the same city, 5 for meeting the posting's years of experience.
+    def __init__(self, candidates):
+        ids, names, cities, experience = [], [], [], []
+        skill_ids, skill_offsets = [], [0]
+        self.skills = []
+        self._skill_lookup = {}
+        self._city_lookup = {}
+        postings = defaultdict(list)
+        for row, (candidate_id, parsed) in enumerate(candidates):
+            ids.append(candidate_id)
+            names.append(parsed.get("name", ""))
+            city = location_city(parsed.get("location", ""))
+            cities.append(self._city_lookup.setdefault(city, len(self._city_lookup)))
+            years = CANDIDATE_EXPERIENCE_PATTERN.match(parsed.get("experience", ""))
+            experience.append(float(years.group(1)) if years else np.nan)
+            for skill in {skill.strip().lower() for skill in parsed.get("skills", [])}:
+                if not skill or len(skill) > CANDIDATE_SKILL_MAX_LENGTH:
+                    continue
+                skill_id = self._skill_lookup.get(skill)
+                if skill_id is None:
+                    skill_id = self._skill_lookup[skill] = len(self.skills)
+                    self.skills.append(skill)
+                postings[skill_id].append(row)
+                skill_ids.append(skill_id)
+            skill_offsets.append(len(skill_ids))
+        self.ids = ids
+        self.names = names
+        self.city_codes = np.array(cities, dtype=np.int32)
+        self.experience_years = np.array(experience, dtype=np.float32)
+        self.skill_ids = np.array(skill_ids, dtype=np.int32)
+        self.skill_offsets = np.array(skill_offsets, dtype=np.int64)
+        self.postings = {skill_id: np.array(rows, dtype=np.int32) for skill_id, rows in postings.items()}
+        self.cities = list(self._city_lookup)
+        # One scan of a posting finds every candidate skill it mentions
+        self._skill_matcher = KeywordMatcher(self.skills) if self.skills else None
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_jsonl(cls, path):
+        # Loads bulk_parse.py output; a file parsed more than once keeps its latest record
+        records = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("ok"):
+                    records[record["file"]] = record["parsed"]
+                else:
+                    records.pop(record.get("file"), None)
+        return cls(records.items())
+
+    def job_requirements(self, job):
+        text = f"{job.get('Title', '')}\n{job.get('Description', '')}"
+        skills = self._skill_matcher.find_all(text) if self._skill_matcher else []
+        years = YEARS_OF_EXPERIENCE_PATTERN.findall(text.lower())
+        # A posting without a city has no location requirement; candidates whose city is
+        # unknown share the "" code and must not match it
+        city = location_city(job.get("Location", ""))
+        return {
+            "skill_ids": [self._skill_lookup[skill.lower()] for skill in skills],
+            "city": self._city_lookup.get(city) if city else None,
+            "min_years": max(map(int, years)) if years else None
+        }
+
+    def query(self, job, k=10, min_score=0):
+        if not self.ids:
+            return []
+        requirements = self.job_requirements(job)
+        points = np.zeros(len(self.ids), dtype=np.float32)
+        possible = 0
+        for skill_id in requirements["skill_ids"]:
+            points[self.postings[skill_id]] += 5
+            possible += 5
+        if requirements["city"] is not None:
+            points[self.city_codes == requirements["city"]] += 5
+            possible += 5
+        if requirements["min_years"] is not None:
+            # NaN (experience unknown) never compares as meeting the bar
+            points[self.experience_years >= requirements["min_years"]] += 5
+            possible += 5
+        if possible == 0:
+            return []
+        scores = np.minimum(points / possible * 100, 100).astype(np.int32)
+        eligible = np.flatnonzero(scores >= max(min_score, 1))
+        k = min(k, len(eligible))
+        if k == 0:
+            return []
+        # Ties go to the earlier row, so results are stable from run to run
+        rank_keys = scores[eligible].astype(np.int64) * len(self.ids) - eligible
+        best = eligible[np.argpartition(-rank_keys, k - 1)[:k]]
+        best = best[np.lexsort((best, -scores[best]))]
+        wanted = set(requirements["skill_ids"])
+        results = []
+        for row in best:
+            own = self.skill_ids[self.skill_offsets[row]:self.skill_offsets[row + 1]]
+            years = self.experience_years[row]
+            results.append({
+                "candidate_id": self.ids[row],
+                "name": self.names[row],
+                "score": int(scores[row]),
+                "matched_skills": [self.skills[skill_id] for skill_id in own if skill_id in wanted],
+                "location": self.cities[self.city_codes[row]],
+                "experience_years": None if np.isnan(years) else float(years)
+            })
+        return results
+
+# ---------------- Career Goal Extraction ----------------
+
+# Title and location phrases are capped at this many characters. Unbounded [a-z\s]+
+# runs made every match attempt rescan to the end of the sentence (quadratic on long
+# inputs); with a cap each attempt does bounded work and the whole scan is linear.
+# Phrases start at a word boundary, so a capped phrase never begins mid-word.
+CAREER_PHRASE_MAX_LENGTH = 80
+CAREER_TITLE_SUFFIX = r"(?:engineer|developer|architect|manager|analyst|scientist|designer)"
+CAREER_SENIORITY = r"(?:senior|junior|lead|principal|staff)"
+CAREER_PHRASE = rf"(?<![a-z])[a-z\s]{{1,{CAREER_PHRASE_MAX_LENGTH}}}"
+CAREER_SPACE = r"\s{1,10}"
+CAREER_TITLE_PATTERNS = [
+    re.compile(rf"(?:seeking|looking for|interested in)(?:{CAREER_SPACE}a)?{CAREER_SPACE}(?:role|position|job|career)?{CAREER_SPACE}(?:as|in)?{CAREER_SPACE}(?:an?)?{CAREER_SPACE}({CAREER_SENIORITY}?\s{{0,10}}{CAREER_PHRASE}{CAREER_TITLE_SUFFIX})"),
+    re.compile(rf"(?:become|be){CAREER_SPACE}(?:a|an){CAREER_SPACE}({CAREER_SENIORITY}?\s{{0,10}}{CAREER_PHRASE}{CAREER_TITLE_SUFFIX})")
+]
+# "<title> role" has no leading keyword, so it could start anywhere. It is only tried
+# near places where a title suffix is followed by role/position/job.
+CAREER_TITLE_ROLE_PATTERN = re.compile(rf"{CAREER_SENIORITY}?\s{{0,10}}({CAREER_PHRASE}{CAREER_TITLE_SUFFIX}){CAREER_SPACE}(?:role|position|job)")
+CAREER_TITLE_ROLE_ANCHOR = re.compile(rf"{CAREER_TITLE_SUFFIX}{CAREER_SPACE}(?:role|position|job)")
+# Farther than any CAREER_TITLE_ROLE_PATTERN match can reach either side of its anchor
+CAREER_TITLE_ROLE_REACH = CAREER_PHRASE_MAX_LENGTH + 60
+CAREER_PHRASE_BREAK = re.compile(r"[^a-z\s]")
+CAREER_LOCATION_PATTERNS = [
+    re.compile(rf"(?:in|near|around|based in){CAREER_SPACE}({CAREER_PHRASE}(?:area|city|region|county))"),
+    re.compile(rf"(?:in|near|around|based in){CAREER_SPACE}([a-z]+,\s{{0,10}}[a-z]{{2}})"),
+    # Takes the rest of the phrase, so every match consumes what it scanned
+    re.compile(r"(?:in|near|around|based in)\s+([a-z\s]+)")
+]
+CAREER_GAZETTEER = {
+    "job_titles": [
+        "software engineer", "data scientist", "machine learning engineer",
+        "devops engineer", "full stack developer", "frontend developer",
         "backend developer", "site reliability engineer", "cloud engineer",
         "ai engineer", "web developer", "product manager", "project manager",
         "ux designer", "systems engineer", "solutions architect",
         "data engineer", "ml engineer", "research scientist"
-    ]
-    for title in common_titles:
-        if title in career_goals.lower():
-            goals_data["job_titles"].append(title.title())
-    location_patterns = [
-        r"(?:in|near|around|based in)\s+([a-z\s]+(?:area|city|region|county))",
-        r"(?:in|near|around|based in)\s+([a-z]+,\s*[a-z]{2})",
-        r"(?:in|near|around|based in)\s+([a-z\s]+)"
-    ]
-    for pattern in location_patterns:
-        matches = re.findall(pattern, career_goals.lower())
-        if matches:
-            goals_data["locations"].extend([loc.strip().title() for loc in matches])
-    common_cities = ["new york", "san francisco", "seattle", "boston", "austin", "chicago", 
-                     "los angeles", "denver", "washington dc", "atlanta", "dallas"]
-    for city in common_cities:
-        if city in career_goals.lower():
-            goals_data["locations"].append(city.title())
-    preferences = ["remote", "hybrid", "onsite", "in-office", "work from home", "flexible", "part-time", "full-time"]
-    for pref in preferences:
-        if pref in career_goals.lower():
-            goals_data["work_preferences"].append(pref.title())
-    
-    industries = ["tech", "finance", "healthcare", "education", "manufacturing", 
-                 "retail", "startups", "enterprise", "government", "non-profit", 
-                 "consulting", "e-commerce", "gaming", "entertainment"]
-    for ind in industries:
-        if ind in career_goals.lower():
-            goals_data["industries"].append(ind.title())
-    
-    # Remove duplicates
-    for key in goals_data:
-        goals_data[key] = list(set(goals_data[key]))
-    
-    return goals_data
+    ],
+    "locations": ["new york", "san francisco", "seattle", "boston", "austin", "chicago",
+                  "los angeles", "denver", "washington dc", "atlanta", "dallas"],
+    "work_preferences": ["remote", "hybrid", "onsite", "in-office", "work from home", "flexible", "part-time", "full-time"],
+    "industries": ["tech", "finance", "healthcare", "education", "manufacturing",
+                   "retail", "startups", "enterprise", "government", "non-profit",
+                   "consulting", "e-commerce", "gaming", "entertainment"]
+}
+
+class SubstringScanner:
+    # Finds every vocabulary term that occurs anywhere in the text (plain substring
+    # semantics, overlaps included) in one pass. A trie-shaped regex inside a lookahead
+    # runs at each position and reports the longest term starting there; shorter terms
+    # that are prefixes of it are implied.
+    def __init__(self, terms):
+        self.terms = list(dict.fromkeys(terms))
+        self.pattern = re.compile("(?=(" + KeywordMatcher._trie_pattern(self.terms) + "))")
+        self._prefixes = {
+            term: [other for other in self.terms if other != term and term.startswith(other)]
+            for term in self.terms
+        }
+
+    def find_all(self, text):
+        found = set()
+        for match in self.pattern.finditer(text):
+            term = match.group(1)
+            found.add(term)
+            found.update(self._prefixes[term])
+        return found
+
+CAREER_GAZETTEER_SCANNER = shared_resource(
+    "career_gazetteer_scanner",
+    lambda: SubstringScanner(term for terms in CAREER_GAZETTEER.values() for term in terms)
+)
+
+def find_title_roles(text):
+    # Same matches as CAREER_TITLE_ROLE_PATTERN.findall(text), but each search is confined
+    # to a window around an anchor instead of being attempted at every position. Matches
+    # are pure [a-z\s], so a window never needs to start before the anchor's phrase does.
+    titles = []
+    position = 0
+    breaks = [match.start() for match in CAREER_PHRASE_BREAK.finditer(text)]
+    for anchor in CAREER_TITLE_ROLE_ANCHOR.finditer(text):
+        if anchor.start() < position:
+            continue
+        previous_break = bisect_left(breaks, anchor.start()) - 1
+        phrase_start = breaks[previous_break] + 1 if previous_break >= 0 else 0
+        match = CAREER_TITLE_ROLE_PATTERN.search(
+            text, max(position, phrase_start, anchor.start() - CAREER_TITLE_ROLE_REACH),
+            anchor.start() + CAREER_TITLE_ROLE_REACH
+        )
+        # A match starting past the anchor may be cut short by the window; a later anchor finds it whole
+        if match is not None and match.start() <= anchor.start():
+            titles.append(match.group(1))
+            position = match.end()
+    return titles
+
+def compile_career_goal_keywords(career_goals):
+    lowered = career_goals.lower()
+    goals_data = {category: [] for category in CAREER_GAZETTEER}
+    title_matches = CAREER_TITLE_PATTERNS[0].findall(lowered) + find_title_roles(lowered) + CAREER_TITLE_PATTERNS[1].findall(lowered)
+    goals_data["job_titles"].extend(title.strip().title() for title in title_matches)
+    for pattern in CAREER_LOCATION_PATTERNS:
+        goals_data["locations"].extend(location.strip().title() for location in pattern.findall(lowered))
+    found = CAREER_GAZETTEER_SCANNER.find_all(lowered)
+    for category, terms in CAREER_GAZETTEER.items():
+        goals_data[category].extend(term.title() for term in terms if term in found)
+    # Tuples, because the cached result is shared between callers
+    return {category: tuple(dict.fromkeys(values)) for category, values in goals_data.items()}
+
+# A plain lru_cache would start out empty on every rerun, since each rerun defines the function anew
+compile_career_goal_keywords = shared_resource(
+    "compile_career_goal_keywords", lambda: lru_cache(maxsize=512)(compile_career_goal_keywords)
+)
+
+def extract_career_goal_keywords(career_goals):
+    if not career_goals:
+        return {}
+    # Memoized on the text, which matters for the rerun on every keystroke in the goals step
+    return {category: list(values) for category, values in compile_career_goal_keywords(career_goals).items()}
+
+def prepare_resume_features(resume_data, motivation_data):
+    # Resume-side inputs to scoring, computed once per resume instead of once per job
+    return {
+        "skills": [skill.lower() for skill in resume_data.get("skills", [])],
+        "job_titles": extract_career_goal_keywords(resume_data.get("profile_summary", "")).get("job_titles", []),
+        "location": resume_data.get("location", "").lower(),
+        "motivation_data": motivation_data
+    }
 
-def calculate_job_match_score(job, resume_data, motivation_data):
+def calculate_job_match_score(job, resume_data, motivation_data, features=None):
+    features = features or prepare_resume_features(resume_data, motivation_data)
+    motivation_data = features["motivation_data"]
     match_score = 0
     match_reasons = []
     
     # Check for skill matches
     job_description = job.get("Description", "").lower()
-    resume_skills = [skill.lower() for skill in resume_data.get("skills", [])]
     matched_skills = []
     
-    for skill in resume_skills:
-        if skill.lower() in job_description.lower():
+    for skill in features["skills"]:
+        if skill in job_description:
             match_score += 5
             matched_skills.append(skill)
     
@@ -613,8 +2532,7 @@ def calculate_job_match_score(job, resume_data, motivation_data):
     
     # Check job title match
     job_title = job.get("Title", "").lower()
-    resume_job_titles = extract_career_goal_keywords(resume_data.get("profile_summary", "")).get("job_titles", [])
-    for title in resume_job_titles:
+    for title in features["job_titles"]:
         if title.lower() in job_title:
             match_score += 10
             match_reasons.append(f"Job title '{title}' matches your career goals")
@@ -622,7 +2540,7 @@ def calculate_job_match_score(job, resume_data, motivation_data):
     
     # Check location match
     job_location = job.get("Location", "").lower()
-    if resume_data.get("location", "").lower() in job_location:
+    if features["location"] in job_location:
         match_score += 5
         match_reasons.append("Location matches your resume")
     
@@ -648,6 +2566,153 @@ def calculate_job_match_score(job, resume_data, motivation_data):
         "reasons": match_reasons
     }
 
+@timed("score_jobs")
+def score_jobs(jobs, resume_data=None, motivation_data=None, features=None):
+    # Scores a batch of jobs against one resume, whose features are prepared once for
+    # the whole batch. Returns {"score", "reasons"} per job, in order.
+    features = features or prepare_resume_features(resume_data, motivation_data)
+    return [calculate_job_match_score(job, None, None, features=features) for job in jobs]
+
+# ---------------- Search Pipeline ----------------
+
+def search_job_batches(roles, resume_data, motivation_data, max_jobs, on_progress=None):
+    # The whole search as a generator: yields (role, scored_jobs) for each results page
+    # as soon as it is scraped and scored, pages for every role interleaved, so the first
+    # batch arrives after one page load. Closing it cancels the remaining scrapes.
+    resume_features = prepare_resume_features(resume_data, motivation_data)
+    # Resume-to-description similarity catches synonyms the keyword rules miss;
+    # it breaks ties between jobs with the same rule-based score
+    semantic_index = SemanticIndex()
+    resume_text = resume_vector_text(resume_data, motivation_data)
+
+    def score_batch(jobs):
+        similarities = semantic_index.score_jobs(jobs, resume_text)
+        for job, match_info, similarity in zip(jobs, score_jobs(jobs, features=resume_features), similarities):
+            job["match_score"] = match_info["score"]
+            job["match_reasons"] = match_info["reasons"]
+            job["semantic_score"] = round(similarity * 100)
+        scored.extend(jobs)
+        return jobs
+
+    scored = []
+    yield from stream_role_matches(
+        roles,
+        score_batch,
+        max_jobs,
+        preferred_location=motivation_data.get("preferred_location", ""),
+        preferred_salary=motivation_data.get("preferred_salary", ""),
+        on_progress=on_progress
+    )
+    # Each page was scored against the IDF of the pages indexed before it; once every
+    # page is in, rescore them all against the same IDF so the final ranking compares like with like
+    if scored:
+        similarities = semantic_index.similarities(resume_text)
+        for job, position in zip(scored, semantic_index.add(scored)):
+            job["semantic_score"] = round(float(similarities[position]) * 100)
+
+def select_top_matches(role_jobs, roles, max_jobs):
+    # Top max_jobs per role, skipping postings already picked for an earlier role
+    job_store = get_job_store()
+    seen_keys = set()
+    matches = []
+    for role in roles:
+        unique_jobs = []
+        for job in sorted(role_jobs.get(role, []), key=match_rank, reverse=True):
+            key = job_key(job)
+            if key not in seen_keys:
+                seen_keys.add(key)
+                unique_jobs.append(job)
+        # Results served from the scrape cache may predate the store, so upsert them too;
+        # unchanged postings are left untouched
+        job_store.upsert_jobs(unique_jobs[:max_jobs], role)
+        matches.extend(match_record(job) for job in unique_jobs[:max_jobs])
+    return matches
+
+# ---------------- Results Index ----------------
+
+def match_rank(job):
+    return job["match_score"], job.get("semantic_score", 0)
+
+# Skills the career insights look for across the matched job descriptions
+INSIGHT_SKILLS = ("python", "java", "javascript", "sql", "aws", "azure", "react",
+                  "node.js", "docker", "kubernetes", "agile", "scrum", "ci/cd",
+                  "machine learning", "data science", "artificial intelligence")
+
+class JobIndex:
+    # Built once per result set. Jobs are stored in rank order (best score first),
+    # role and location map to ascending lists of ranks, and a score threshold is
+    # a bisect over the ranked scores, so filtering never scans the full job list.
+    def __init__(self, jobs, missing=0):
+        self.jobs = sorted(jobs, key=match_rank, reverse=True)
+        # Matches whose posting is no longer in the job store
+        self.missing = missing
+        self._negated_scores = [-job["match_score"] for job in self.jobs]
+        self._postings = {"role": defaultdict(list), "location": defaultdict(list)}
+        for rank, job in enumerate(self.jobs):
+            self._postings["role"][job["Job Role"]].append(rank)
+            self._postings["location"][job["Location"]].append(rank)
+        self._posting_sets = {
+            field: {key: set(ranks) for key, ranks in postings.items()}
+            for field, postings in self._postings.items()
+        }
+        self.roles = list(self._postings["role"])
+        self.locations = list(self._postings["location"])
+        self.average_score = sum(job["match_score"] for job in self.jobs) / len(self.jobs) if self.jobs else 0
+        self.top_match = self.jobs[0] if self.jobs else None
+        # In order of first appearance across the matches as given (role by role), as the
+        # insights always listed them; rank order would change the top-10 and top-5 lists
+        self.in_demand_skills = []
+        for job in jobs:
+            description = job["Description"].lower()
+            for skill in INSIGHT_SKILLS:
+                if skill in description and skill not in self.in_demand_skills:
+                    self.in_demand_skills.append(skill)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def query(self, role="All", location="All", min_score=0):
+        # Ranks below the cutoff are exactly the jobs scoring >= min_score
+        cutoff = bisect_right(self._negated_scores, -min_score)
+        filters = [(field, value) for field, value in (("role", role), ("location", location)) if value != "All"]
+        if not filters:
+            return self.jobs[:cutoff]
+        # Walk the shortest posting list and probe the others
+        filters.sort(key=lambda f: len(self._postings[f[0]].get(f[1], ())))
+        field, value = filters[0]
+        ranks = self._postings[field].get(value, [])
+        ranks = ranks[:bisect_left(ranks, cutoff)]
+        others = [self._posting_sets[f].get(v, set()) for f, v in filters[1:]]
+        return [self.jobs[rank] for rank in ranks if all(rank in other for other in others)]
+
+def match_record(job):
+    # What a session keeps per match; the posting itself lives in the job store
+    return {
+        "job_key": job_key(job),
+        "Job Role": job["Job Role"],
+        "match_score": job["match_score"],
+        "semantic_score": job.get("semantic_score", 0),
+        "match_reasons": job["match_reasons"]
+    }
+
+def load_job_matches(matches):
+    # Matches whose posting has gone from the store (e.g. a wiped cache directory) are left out
+    postings = get_job_store().get_jobs(match["job_key"] for match in matches)
+    jobs = []
+    for match in matches:
+        posting = postings.get(match["job_key"])
+        if posting is not None:
+            jobs.append({**posting, **match})
+    return jobs
+
+def get_job_index():
+    # Rebuild only when a new search replaced the result list
+    if st.session_state.job_index is None or st.session_state.job_index_source is not st.session_state.job_matches:
+        jobs = load_job_matches(st.session_state.job_matches)
+        st.session_state.job_index = JobIndex(jobs, missing=len(st.session_state.job_matches) - len(jobs))
+        st.session_state.job_index_source = st.session_state.job_matches
+    return st.session_state.job_index
+
 # ---------------- Main App Functions ----------------
 
 # Initialize session state variables
@@ -664,6 +2729,9 @@ def init_session_state():
         st.session_state.job_matches = []
     if 'match_complete' not in st.session_state:
         st.session_state.match_complete = False
+    if 'job_index' not in st.session_state:
+        st.session_state.job_index = None
+        st.session_state.job_index_source = None
 
 def navigation_buttons():
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -702,7 +2770,8 @@ def resume_upload_step():
     if uploaded_file is not None:
         with st.spinner("Analyzing your resume..."):
             try:
-                parsed_data = parse_resume(uploaded_file)
+                # Reruns with the same file in the uploader only cost a hash
+                parsed_data = parse_resume_cached(uploaded_file)
                 st.session_state.parsed_resume = parsed_data
                 st.markdown('<div class="success-box">', unsafe_allow_html=True)
                 st.markdown("✅ Resume successfully parsed! Here's what we found:")
@@ -923,7 +2992,7 @@ def job_matching_step():
         
         # Ensure we have at least one job role to search
         if not job_roles_to_search:
-            job_roles_to_search = ["Software Engineer", "Data Scientist", "Full Stack Developer"]
+            job_roles_to_search = list(DEFAULT_JOB_ROLES)
         
         # Remove duplicates and limit to top 3
         job_roles_to_search = list(set(job_roles_to_search))[:3]
@@ -933,48 +3002,71 @@ def job_matching_step():
         with col1:
             selected_roles = st.multiselect(
                 "Select job roles to search for:",
-                job_roles_to_search + ["DevOps Engineer", "Data Engineer", "Frontend Developer", "Backend Developer"],
+                job_roles_to_search + EXTRA_JOB_ROLES,
                 default=job_roles_to_search
             )
         
         with col2:
             max_jobs = st.number_input("Maximum number of jobs per role:", min_value=1, max_value=10, value=3)
         
+        ages = [
+            search_freshness(role, st.session_state.motivation_data.get("preferred_location", ""),
+                             st.session_state.motivation_data.get("preferred_salary", ""))
+            for role in selected_roles
+        ]
+        warm = [age for age in ages if age is not None and age < SCRAPE_CACHE_TTL + SCRAPE_CACHE_STALE_TTL]
+        if warm:
+            st.caption(f"Recent results are ready for {len(warm)} of {len(ages)} selected roles "
+                       f"(refreshed {max(warm) / 60:.0f} minutes ago or sooner).")
+        
         if st.button("Find Matching Jobs", key="find_jobs_button"):
             if selected_roles:
-                with st.spinner("Searching for matching jobs... This may take a few moments"):
+                search_progress = st.progress(0.0, text="Searching job boards...")
+                best_so_far = st.empty()
+                with st.status("Searching for matching jobs...", expanded=True) as search_status:
                     try:
-                        driver = init_driver()
-                        all_jobs = []
+                        # Session state is only reachable from the script thread, so capture it for the workers
+                        resume_data = st.session_state.parsed_resume
+                        motivation_data = st.session_state.motivation_data
+                        
+                        def show_progress(pages_done, pages_expected):
+                            search_progress.progress(
+                                min(1.0, pages_done / pages_expected) if pages_expected else 1.0,
+                                text=f"Scanned {pages_done} of up to {pages_expected} result pages"
+                            )
+                        
+                        role_jobs = {role: [] for role in selected_roles}
+                        found_so_far = []
+                        started = time.perf_counter()
                         
-                        for role in selected_roles:
-                            jobs = scrape_dice(
-                                role, 
-                                driver,
-                                preferred_location=st.session_state.motivation_data.get("preferred_location", ""),
-                                preferred_salary=st.session_state.motivation_data.get("preferred_salary", "")
+                        # Each results page shows up here as soon as it has been scraped and scored
+                        for role, scored_jobs in search_job_batches(
+                            selected_roles, resume_data, motivation_data, max_jobs, on_progress=show_progress
+                        ):
+                            role_jobs[role].extend(scored_jobs)
+                            found_so_far.extend(scored_jobs)
+                            found_so_far.sort(key=match_rank, reverse=True)
+                            best_in_batch = max(scored_jobs, key=match_rank)
+                            search_status.markdown(
+                                f"**{escape(role)}** · {len(scored_jobs)} jobs after {time.perf_counter() - started:.1f}s · "
+                                f"best {best_in_batch['match_score']}%: {escape(best_in_batch['Title'])} at {escape(best_in_batch['Company Name'])}"
                             )
-                            jobs_with_scores = []
-                            
-                            for job in jobs:
-                                match_info = calculate_job_match_score(
-                                    job, 
-                                    st.session_state.parsed_resume, 
-                                    st.session_state.motivation_data
+                            with best_so_far.container():
+                                st.markdown(f"Scanned {len(found_so_far)} jobs so far. Best matches:")
+                                st.dataframe(
+                                    pd.DataFrame(
+                                        [{"Title": job["Title"], "Company": job["Company Name"], "Match Score": job["match_score"]}
+                                         for job in found_so_far[:10]]
+                                    ),
+                                    hide_index=True
                                 )
-                                job["match_score"] = match_info["score"]
-                                job["match_reasons"] = match_info["reasons"]
-                                jobs_with_scores.append(job)
-                            
-                            # Sort by match score and take top N
-                            sorted_jobs = sorted(jobs_with_scores, key=lambda x: x["match_score"], reverse=True)
-                            all_jobs.extend(sorted_jobs[:max_jobs])
                         
-                        driver.quit()
-                        st.session_state.job_matches = all_jobs
+                        st.session_state.job_matches = select_top_matches(role_jobs, selected_roles, max_jobs)
                         st.session_state.match_complete = True
+                        search_status.update(label=f"Search finished in {time.perf_counter() - started:.1f}s", state="complete")
                         st.rerun()
                     except Exception as e:
+                        search_status.update(label="Search failed", state="error")
                         st.markdown('<div class="error-box">', unsafe_allow_html=True)
                         st.markdown(f"❌ Error searching for jobs: {str(e)}")
                         st.markdown("Please try again later or contact support if the issue persists.")
@@ -1002,6 +3094,60 @@ def job_matching_step():
                 st.session_state.match_complete = False
                 st.rerun()
 
+RESULTS_PAGE_SIZES = [10, 25, 50, 100]
+
+def render_job_card(job):
+    match_class = "match-high" if job["match_score"] >= 80 else "match-medium" if job["match_score"] >= 60 else "match-low"
+    reasons_html = "".join(f"<li>{escape(reason)}</li>" for reason in job["match_reasons"])
+    # Whole card in a single element to keep the page payload small
+    st.markdown(f"""
+    <div class="result-card {match_class}">
+        <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+            <div>
+                <h3 style="margin-top: 0;">{escape(job['Title'])}</h3>
+                <div><b>Company:</b> {escape(job['Company Name'])} | <b>Location:</b> {escape(job['Location'])}</div>
+                <div><b>Job Type:</b> {escape(job['Job Type'])} | <b>Posted:</b> {escape(job['Posted Time'])}</div>
+            </div>
+            <div style="text-align: center; margin-top: 10px; min-width: 120px;">
+                <div style="font-size: 2rem; font-weight: 600; color: #1976D2;">{job["match_score"]}%</div>
+                <div style="font-size: 0.9rem; color: #546E7A;">Match Score</div>
+                <div style="font-size: 0.8rem; color: #546E7A;">{job.get("semantic_score", 0)}% resume similarity</div>
+            </div>
+        </div>
+        <h4>Why this matches your profile:</h4>
+        <ul>{reasons_html}</ul>
+        <a href="{escape(job['Apply Link'])}" target="_blank">Apply Now</a>
+    </div>
+    """, unsafe_allow_html=True)
+    # Descriptions are only sent to the browser when asked for. The key includes the role so a
+    # posting listed under two roles still gets two distinct widgets; it stays stable across
+    # pages and filters, unlike the card's position.
+    card_id = f"{job['Job Role']}\n{job['Apply Link']}"
+    description_key = "description_" + hashlib.sha1(card_id.encode("utf-8")).hexdigest()[:16]
+    if st.checkbox("View Description", key=description_key):
+        st.markdown(job["Description"])
+
+def render_job_table(jobs):
+    st.dataframe(
+        pd.DataFrame([{
+            "Match Score": job["match_score"],
+            "Similarity": job.get("semantic_score", 0),
+            "Title": job["Title"],
+            "Company": job["Company Name"],
+            "Location": job["Location"],
+            "Job Type": job["Job Type"],
+            "Posted": job["Posted Time"],
+            "Job Role": job["Job Role"],
+            "Apply Link": job["Apply Link"]
+        } for job in jobs]),
+        column_config={
+            "Match Score": st.column_config.ProgressColumn("Match Score", format="%d%%", min_value=0, max_value=100),
+            "Similarity": st.column_config.NumberColumn("Similarity", format="%d%%", help="How closely the description matches your resume"),
+            "Apply Link": st.column_config.LinkColumn("Apply Link", display_text="Apply Now")
+        },
+        hide_index=True
+    )
+
 # Step 5: Results & Recommendations
 def results_step():
     st.markdown('<h2 class="step-header">Step 5: Results & Recommendations</h2>', unsafe_allow_html=True)
@@ -1012,11 +3158,19 @@ def results_step():
         st.markdown('</div>', unsafe_allow_html=True)
         return
     
-    # Calculate aggregate statistics
-    avg_match_score = sum(job["match_score"] for job in st.session_state.job_matches) / len(st.session_state.job_matches)
-    top_match = max(st.session_state.job_matches, key=lambda x: x["match_score"])
-    job_roles = set(job["Job Role"] for job in st.session_state.job_matches)
-    locations = set(job["Location"] for job in st.session_state.job_matches)
+    # Aggregate statistics are computed once per result set by the index
+    job_index = get_job_index()
+    if not len(job_index):
+        st.markdown('<div class="warning-box">', unsafe_allow_html=True)
+        st.markdown("⚠️ The job postings for these matches are no longer available. Please go back to the previous step and search again.")
+        st.markdown('</div>', unsafe_allow_html=True)
+        return
+    if job_index.missing:
+        st.caption(f"{job_index.missing} of {job_index.missing + len(job_index)} matches are no longer available and are not shown.")
+    avg_match_score = job_index.average_score
+    top_match = job_index.top_match
+    job_roles = job_index.roles
+    locations = job_index.locations
     
     # Display match metrics
     st.markdown('<div class="subheader">Match Summary</div>', unsafe_allow_html=True)
@@ -1025,7 +3179,7 @@ def results_step():
     
     with col1:
         st.markdown('<div class="metric-container">', unsafe_allow_html=True)
-        st.markdown(f'<div class="metric-value">{len(st.session_state.job_matches)}</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="metric-value">{len(job_index)}</div>', unsafe_allow_html=True)
         st.markdown('<div class="metric-label">Matching Jobs Found</div>', unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -1055,54 +3209,38 @@ def results_step():
     with col3:
         match_threshold = st.slider("Minimum Match Score", 0, 100, 50)
     
-    # Filter jobs based on selections
-    filtered_jobs = st.session_state.job_matches
-    
-    if selected_role != "All":
-        filtered_jobs = [job for job in filtered_jobs if job["Job Role"] == selected_role]
-    
-    if selected_location != "All":
-        filtered_jobs = [job for job in filtered_jobs if job["Location"] == selected_location]
-    
-    filtered_jobs = [job for job in filtered_jobs if job["match_score"] >= match_threshold]
-    
-    # Sort jobs by match score
-    sorted_jobs = sorted(filtered_jobs, key=lambda x: x["match_score"], reverse=True)
-    
-    # Display filtered results count
-    st.markdown(f"Showing {len(sorted_jobs)} jobs matching your criteria")
+    # Filter jobs based on selections; the index returns them already sorted by match score
+    sorted_jobs = job_index.query(selected_role, selected_location, match_threshold)
     
     # Display job matches
     if sorted_jobs:
-        for job in sorted_jobs:
-            match_class = "match-high" if job["match_score"] >= 80 else "match-medium" if job["match_score"] >= 60 else "match-low"
-            
-            st.markdown(f'<div class="result-card {match_class}">', unsafe_allow_html=True)
-            
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.markdown(f"### {job['Title']}")
-                st.markdown(f"**Company:** {job['Company Name']} | **Location:** {job['Location']}")
-                st.markdown(f"**Job Type:** {job['Job Type']} | **Posted:** {job['Posted Time']}")
-            
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            view_mode = st.radio("View", ["Cards", "Table"], horizontal=True, key="results_view")
+        
+        if view_mode == "Table":
+            # One virtualized grid instead of a block of widgets per job
+            st.markdown(f"Showing {len(sorted_jobs)} jobs matching your criteria")
+            render_job_table(sorted_jobs)
+        else:
             with col2:
-                st.markdown(f'<div style="text-align: center; margin-top: 10px;">', unsafe_allow_html=True)
-                st.markdown(f'<div style="font-size: 2rem; font-weight: 600; color: #1976D2;">{job["match_score"]}%</div>', unsafe_allow_html=True)
-                st.markdown(f'<div style="font-size: 0.9rem; color: #546E7A;">Match Score</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
+                page_size = st.selectbox("Jobs per page", RESULTS_PAGE_SIZES, key="results_page_size")
             
-            st.markdown("#### Why this matches your profile:")
-            for reason in job["match_reasons"]:
-                st.markdown(f"- {reason}")
+            page_count = max(1, math.ceil(len(sorted_jobs) / page_size))
+            # Filters can shrink the result set below the page the user was on
+            if st.session_state.get("results_page", 1) > page_count:
+                st.session_state.results_page = page_count
             
-            st.markdown("#### Job Description:")
-            with st.expander("View Description"):
-                st.markdown(job["Description"])
+            with col3:
+                page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, step=1, key="results_page")
             
-            st.markdown(f"[Apply Now]({job['Apply Link']})")
+            first = (page - 1) * page_size
+            page_jobs = sorted_jobs[first:first + page_size]
+            st.markdown(f"Showing {first + 1}-{first + len(page_jobs)} of {len(sorted_jobs)} jobs matching your criteria")
             
-            st.markdown('</div>', unsafe_allow_html=True)
+            for job in page_jobs:
+                render_job_card(job)
     else:
         st.markdown('<div class="warning-box">', unsafe_allow_html=True)
         st.markdown("⚠️ No jobs match your current filter criteria. Try adjusting the filters.")
@@ -1112,16 +3250,8 @@ def results_step():
     if st.session_state.job_matches:
         st.markdown('<div class="subheader">Career Insights</div>', unsafe_allow_html=True)
         
-        # Extract all skills mentioned across job descriptions
-        all_skills = []
-        common_skills = ["python", "java", "javascript", "sql", "aws", "azure", "react", 
-                         "node.js", "docker", "kubernetes", "agile", "scrum", "ci/cd",
-                         "machine learning", "data science", "artificial intelligence"]
-        
-        for job in st.session_state.job_matches:
-            for skill in common_skills:
-                if skill in job["Description"].lower() and skill not in all_skills:
-                    all_skills.append(skill)
+        # Skills mentioned across job descriptions, collected once per result set by the index
+        all_skills = get_job_index().in_demand_skills
         
         # Find skills gap
         user_skills = [skill.lower() for skill in st.session_state.parsed_resume.get("skills", [])]
@@ -1159,23 +3289,30 @@ def results_step():
 def main():
     add_custom_css()
     init_session_state()
+    begin_stage_trace()
+    if PRESCRAPE_ENABLED:
+        get_prescrape_scheduler()
     
     show_app_header()
     show_progress()
     
-    if st.session_state.current_step == 1:
-        resume_upload_step()
-    elif st.session_state.current_step == 2:
-        career_goals_step()
-    elif st.session_state.current_step == 3:
-        motivation_matrix_step()
-    elif st.session_state.current_step == 4:
-        job_matching_step()
-    elif st.session_state.current_step == 5:
-        results_step()
+    with timed(f"step{st.session_state.current_step}"):
+        if st.session_state.current_step == 1:
+            resume_upload_step()
+        elif st.session_state.current_step == 2:
+            career_goals_step()
+        elif st.session_state.current_step == 3:
+            motivation_matrix_step()
+        elif st.session_state.current_step == 4:
+            job_matching_step()
+        elif st.session_state.current_step == 5:
+            results_step()
     
     navigation_buttons()
     
+    if DEV_PANEL or st.query_params.get("dev") == "1":
+        show_dev_panel()
+    
     # Footer
     st.markdown('<div class="footer">', unsafe_allow_html=True)
     st.markdown("Career Compass | Resume Parser & Job Matching Assistant | © 2023")